@@ -2,7 +2,10 @@
 
 from ai.mcts import MCTS, MCTSPlayer
 from ai.evolutionary import EvolutionaryPlayer, EvolutionaryWeights, TRAINED_WEIGHTS
-from ai.heuristics import evaluate_state, evaluate_card_value, should_neigh
+from ai.heuristics import (
+    evaluate_state, evaluate_card_value, should_neigh,
+    encode_state_features, evaluate_states_batch,
+)
 from ai.hybrid import HybridMCTS, HybridPlayer
 from ai.ismcts import ISMCTS, ISMCTSPlayer
 
@@ -17,6 +20,8 @@ __all__ = [
     "EvolutionaryWeights",
     "TRAINED_WEIGHTS",
     "evaluate_state",
+    "encode_state_features",
+    "evaluate_states_batch",
     "evaluate_card_value",
     "should_neigh",
 ]
@@ -71,6 +71,17 @@ DIFFICULTY_CONFIGS = {
 }
 
 
+# Accepted spellings for each level: full names plus short forms
+_DIFFICULTY_NAMES = {level.value: level for level in DifficultyLevel}
+_DIFFICULTY_NAMES.update({
+    "e": DifficultyLevel.EASY,
+    "m": DifficultyLevel.MEDIUM,
+    "h": DifficultyLevel.HARD,
+    "x": DifficultyLevel.EXPERT,
+    "n": DifficultyLevel.NIGHTMARE,
+})
+
+
 def create_ai_player(name: str, difficulty: DifficultyLevel) -> object:
     """Create an AI player with the specified difficulty level."""
     config = DIFFICULTY_CONFIGS[difficulty]
@@ -130,19 +141,4 @@ def list_difficulties() -> str:
 
 def parse_difficulty(difficulty_str: str) -> Optional[DifficultyLevel]:
     """Parse a difficulty string to a DifficultyLevel."""
-    difficulty_str = difficulty_str.lower().strip()
-
-    for level in DifficultyLevel:
-        if level.value == difficulty_str:
-            return level
-
-    # Also accept short forms
-    short_forms = {
-        "e": DifficultyLevel.EASY,
-        "m": DifficultyLevel.MEDIUM,
-        "h": DifficultyLevel.HARD,
-        "x": DifficultyLevel.EXPERT,
-        "n": DifficultyLevel.NIGHTMARE,
-    }
-
-    return short_forms.get(difficulty_str)
+    return _DIFFICULTY_NAMES.get(difficulty_str.lower().strip())
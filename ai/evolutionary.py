@@ -4,11 +4,19 @@ Uses evolved weights for heuristic evaluation to make decisions.
 Based on the approach from the Charles University thesis by Michal Kodad.
 """
 
+import copy
 import random
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, fields
 from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
 
+from cards.card import CardInstance, CardType
+from game.action import ActionType
+from game.game_engine import GameEngine
+from game.game_state import PlayerState, UnicornSummary
+from players.ai_player import RandomPlayer
 from players.player import Player
+from ai.simulation import seeded_random
 
 if TYPE_CHECKING:
     from game.game_state import GameState
@@ -49,70 +57,61 @@ class EvolutionaryWeights:
     ginormous_bonus: float = 1.5
     magical_kittencorn_bonus: float = 2.0
 
+    def to_vector(self) -> List[float]:
+        """Return the weights as a flat list in field declaration order."""
+        return [getattr(self, f.name) for f in fields(self)]
+
+    @classmethod
+    def from_vector(cls, values: List[float]) -> 'EvolutionaryWeights':
+        """Build weights from a flat list in field declaration order."""
+        return cls(**{f.name: value for f, value in zip(fields(cls), values)})
+
     def mutate(self, mutation_rate: float = 0.1, mutation_strength: float = 0.3) -> 'EvolutionaryWeights':
         """Create a mutated copy of these weights."""
-        new_weights = EvolutionaryWeights(
-            basic_unicorn=self.basic_unicorn,
-            magical_unicorn=self.magical_unicorn,
-            baby_unicorn=self.baby_unicorn,
-            upgrade=self.upgrade,
-            downgrade=self.downgrade,
-            magic=self.magic,
-            instant=self.instant,
-            unicorn_count=self.unicorn_count,
-            unicorn_lead=self.unicorn_lead,
-            hand_size=self.hand_size,
-            upgrade_count=self.upgrade_count,
-            downgrade_penalty=self.downgrade_penalty,
-            close_to_win=self.close_to_win,
-            end_action_penalty=self.end_action_penalty,
-            neigh_value=self.neigh_value,
-            pass_neigh_value=self.pass_neigh_value,
-            yay_bonus=self.yay_bonus,
-            rainbow_aura_bonus=self.rainbow_aura_bonus,
-            ginormous_bonus=self.ginormous_bonus,
-            magical_kittencorn_bonus=self.magical_kittencorn_bonus,
-        )
+        new_weights = copy.copy(self)
 
         # Mutate each weight with probability mutation_rate
-        for attr in [
-            'basic_unicorn', 'magical_unicorn', 'baby_unicorn',
-            'upgrade', 'downgrade', 'magic', 'instant',
-            'unicorn_count', 'unicorn_lead', 'hand_size',
-            'upgrade_count', 'downgrade_penalty', 'close_to_win',
-            'end_action_penalty', 'neigh_value', 'pass_neigh_value',
-            'yay_bonus', 'rainbow_aura_bonus', 'ginormous_bonus',
-            'magical_kittencorn_bonus'
-        ]:
+        for f in fields(new_weights):
             if random.random() < mutation_rate:
-                current = getattr(new_weights, attr)
-                delta = random.gauss(0, mutation_strength)
-                setattr(new_weights, attr, current + delta)
+                setattr(new_weights, f.name,
+                        getattr(new_weights, f.name) + random.gauss(0, mutation_strength))
 
         return new_weights
 
     @staticmethod
     def crossover(parent1: 'EvolutionaryWeights', parent2: 'EvolutionaryWeights') -> 'EvolutionaryWeights':
         """Create offspring by crossing two parent weight sets."""
-        attrs = [
-            'basic_unicorn', 'magical_unicorn', 'baby_unicorn',
-            'upgrade', 'downgrade', 'magic', 'instant',
-            'unicorn_count', 'unicorn_lead', 'hand_size',
-            'upgrade_count', 'downgrade_penalty', 'close_to_win',
-            'end_action_penalty', 'neigh_value', 'pass_neigh_value',
-            'yay_bonus', 'rainbow_aura_bonus', 'ginormous_bonus',
-            'magical_kittencorn_bonus'
-        ]
-
-        child = EvolutionaryWeights()
-        for attr in attrs:
-            # Randomly pick from either parent or blend
-            if random.random() < 0.5:
-                setattr(child, attr, getattr(parent1, attr))
-            else:
-                setattr(child, attr, getattr(parent2, attr))
-
-        return child
+        # Randomly pick each weight from either parent
+        return EvolutionaryWeights.from_vector([
+            value1 if random.random() < 0.5 else value2
+            for value1, value2 in zip(parent1.to_vector(), parent2.to_vector())
+        ])
+
+
+# Weight that values a card of each type
+CARD_TYPE_WEIGHTS: Dict[CardType, str] = {
+    CardType.BASIC_UNICORN: "basic_unicorn",
+    CardType.MAGICAL_UNICORN: "magical_unicorn",
+    CardType.BABY_UNICORN: "baby_unicorn",
+    CardType.UPGRADE: "upgrade",
+    CardType.DOWNGRADE: "downgrade",
+    CardType.MAGIC: "magic",
+    CardType.INSTANT: "instant",
+}
+
+# Bonus per threatening opponent for cards that can slow them down
+DISRUPTION_BONUS: Dict[CardType, float] = {
+    CardType.MAGIC: 1.0,
+    CardType.DOWNGRADE: 1.5,
+}
+
+# Special cards whose play is boosted by a dedicated weight
+EFFECT_BONUS_WEIGHTS: Dict[str, str] = {
+    "yay": "yay_bonus",
+    "rainbow_aura": "rainbow_aura_bonus",
+    "ginormous_unicorn": "ginormous_bonus",
+    "magical_kittencorn": "magical_kittencorn_bonus",
+}
 
 
 class EvolutionaryPlayer(Player):
@@ -128,104 +127,124 @@ class EvolutionaryPlayer(Player):
         super().__init__(name)
         self.weights = weights or EvolutionaryWeights()
 
+        # Action types without a scorer score 0
+        self._action_scorers = {
+            ActionType.END_ACTION_PHASE: self._score_end_action,
+            ActionType.DRAW_CARD: self._score_draw,
+            ActionType.PLAY_CARD: self._score_play,
+            ActionType.NEIGH: self._score_neigh,
+            ActionType.PASS_NEIGH: self._score_pass_neigh,
+            ActionType.CHOOSE_TARGET: self._score_choose_target,
+        }
+
     def choose_action(self, state: 'GameState', valid_actions: List['Action']) -> 'Action':
         """Choose action based on evolved heuristics."""
         if len(valid_actions) == 1:
             return valid_actions[0]
 
-        # Score each action
-        scored_actions = []
-        for action in valid_actions:
-            score = self._evaluate_action(state, action)
-            scored_actions.append((score, action))
+        # Unicorn counts can't change while we score, so count stables once
+        summary = state.unicorn_summary()
+
+        # Take an immediately winning unicorn play without scoring anything
+        player_idx = valid_actions[0].player_idx
+        if not state.players[player_idx].unicorns_are_pandas:
+            needed = state.unicorns_to_win - summary.counts[player_idx]
+            for action in valid_actions:
+                if action.action_type == ActionType.PLAY_CARD and action.card.is_unicorn():
+                    gained = 2 if action.card.card.effect_id == "ginormous_unicorn" else 1
+                    if gained >= needed:
+                        return action
+
+        # Pick the best-scoring action (first one wins ties)
+        return max(
+            valid_actions,
+            key=lambda action: self._evaluate_action(state, action, summary)
+        )
+
+    def _evaluate_action(
+        self,
+        state: 'GameState',
+        action: 'Action',
+        summary: Optional[UnicornSummary] = None
+    ) -> float:
+        """Evaluate an action using evolved weights.
+
+        Args:
+            state: Current game state
+            action: Action to score
+            summary: Unicorn summary of the state, if already known
+        """
+        scorer = self._action_scorers.get(action.action_type)
+        if scorer is None:
+            return 0.0
+        return scorer(state, action, summary)
+
+    def _score_end_action(self, state: 'GameState', action: 'Action',
+                          summary: Optional[UnicornSummary]) -> float:
+        """Score ending the action phase."""
+        return self.weights.end_action_penalty
+
+    def _score_draw(self, state: 'GameState', action: 'Action',
+                    summary: Optional[UnicornSummary]) -> float:
+        """Score drawing a card."""
+        return 1.0  # Drawing is always good
+
+    def _score_play(self, state: 'GameState', action: 'Action',
+                    summary: Optional[UnicornSummary]) -> float:
+        """Score playing a card from hand."""
+        if summary is None:
+            summary = state.unicorn_summary()
+
+        card = action.card
+        to_win = state.unicorns_to_win
+        return _score_play_card(
+            self.weights,
+            card.card_type,
+            card.card.effect_id,
+            card.is_unicorn() and summary.counts[action.player_idx] >= to_win - 2,
+            _count_threatening(summary, action.player_idx, to_win),
+        )
 
-        # Sort by score and pick best
-        scored_actions.sort(key=lambda x: x[0], reverse=True)
-        return scored_actions[0][1]
+    def _score_neigh(self, state: 'GameState', action: 'Action',
+                     summary: Optional[UnicornSummary]) -> float:
+        """Score Neighing the card being played."""
+        score = self.weights.neigh_value
 
-    def _evaluate_action(self, state: 'GameState', action: 'Action') -> float:
-        """Evaluate an action using evolved weights."""
-        from game.action import ActionType
-        from cards.card import CardType
+        # Extra value if opponent is close to winning
+        if state.card_being_played and state.card_being_played.is_unicorn():
+            if summary is None:
+                summary = state.unicorn_summary()
+            threatening = _count_threatening(summary, action.player_idx, state.unicorns_to_win)
+            score += 5.0 * threatening  # Critical Neigh!
 
-        score = 0.0
-        player_idx = action.player_idx
-        player = state.players[player_idx]
-        w = self.weights
+        return score
 
-        if action.action_type == ActionType.END_ACTION_PHASE:
-            return w.end_action_penalty
-
-        if action.action_type == ActionType.DRAW_CARD:
-            return 1.0  # Drawing is always good
-
-        if action.action_type == ActionType.PLAY_CARD:
-            card = action.card
-
-            # Base score by card type
-            if card.card_type == CardType.BASIC_UNICORN:
-                score += w.basic_unicorn
-            elif card.card_type == CardType.MAGICAL_UNICORN:
-                score += w.magical_unicorn
-            elif card.card_type == CardType.BABY_UNICORN:
-                score += w.baby_unicorn
-            elif card.card_type == CardType.UPGRADE:
-                score += w.upgrade
-            elif card.card_type == CardType.DOWNGRADE:
-                score += w.downgrade
-            elif card.card_type == CardType.MAGIC:
-                score += w.magic
-
-            # Special card bonuses
-            effect_id = card.card.effect_id
-            if effect_id == "yay":
-                score += w.yay_bonus
-            elif effect_id == "rainbow_aura":
-                score += w.rainbow_aura_bonus
-            elif effect_id == "ginormous_unicorn":
-                score += w.ginormous_bonus
-            elif effect_id == "magical_kittencorn":
-                score += w.magical_kittencorn_bonus
-
-            # Close to winning bonus
-            current_unicorns = player.unicorn_count()
-            if card.is_unicorn():
-                if current_unicorns >= state.unicorns_to_win - 2:
-                    score += w.close_to_win
-
-            # Consider if opponents are close to winning
-            for other in state.players:
-                if other.player_idx != player_idx:
-                    if other.unicorn_count() >= state.unicorns_to_win - 1:
-                        # Prioritize defensive/disruption cards
-                        if card.card_type == CardType.MAGIC:
-                            score += 1.0
-                        elif card.card_type == CardType.DOWNGRADE:
-                            score += 1.5
-
-        elif action.action_type == ActionType.NEIGH:
-            score += w.neigh_value
-
-            # Extra value if opponent is close to winning
-            if state.card_being_played and state.card_being_played.is_unicorn():
-                for other in state.players:
-                    if other.player_idx != player_idx:
-                        if other.unicorn_count() >= state.unicorns_to_win - 1:
-                            score += 5.0  # Critical Neigh!
-
-        elif action.action_type == ActionType.PASS_NEIGH:
-            score += w.pass_neigh_value
-
-            # Consider if we should save Neigh cards
-            neigh_count = sum(
-                1 for c in player.hand
-                if c.card_type == CardType.INSTANT
-            )
-            if neigh_count <= 1:
-                score += 0.5  # Save our last Neigh
+    def _score_pass_neigh(self, state: 'GameState', action: 'Action',
+                          summary: Optional[UnicornSummary]) -> float:
+        """Score passing on a Neigh opportunity."""
+        score = self.weights.pass_neigh_value
+
+        # Consider if we should save Neigh cards
+        neigh_count = sum(
+            1 for c in state.players[action.player_idx].hand
+            if c.card_type == CardType.INSTANT
+        )
+        if neigh_count <= 1:
+            score += 0.5  # Save our last Neigh
 
         return score
 
+    def _score_choose_target(self, state: 'GameState', action: 'Action',
+                             summary: Optional[UnicornSummary]) -> float:
+        """Score choosing an effect target (skipping scores 0)."""
+        if action.target_card is not None:
+            target = action.target_card
+        elif action.target_player_idx is not None:
+            target = state.players[action.target_player_idx]
+        else:
+            return 0.0
+        return self._score_target(state, target, action.player_idx)
+
     def evaluate_state(self, state: 'GameState', player_idx: int) -> float:
         """Evaluate a game state for a player."""
         player = state.players[player_idx]
@@ -238,13 +257,14 @@ class EvolutionaryPlayer(Player):
 
         score = 0.0
 
+        summary = state.unicorn_summary()
+
         # Unicorn count
-        unicorn_count = player.unicorn_count()
+        unicorn_count = summary.counts[player_idx]
         score += unicorn_count * w.unicorn_count
 
         # Lead over opponents
-        other_max = max(p.unicorn_count() for p in state.players if p.player_idx != player_idx)
-        lead = unicorn_count - other_max
+        lead = unicorn_count - summary.max_other[player_idx]
         score += lead * w.unicorn_lead
 
         # Close to winning
@@ -267,10 +287,29 @@ class EvolutionaryPlayer(Player):
         prompt: str
     ) -> object:
         """Choose target based on heuristics."""
-        # For destruction: target opponent's best unicorn
-        # For stealing: target opponent's best card
-        # Default to random if no clear preference
-        return random.choice(valid_targets)
+        # For destruction/stealing: target the opponent's best card,
+        # or the opponent closest to winning
+        if state.resolution_stack:
+            my_idx = state.resolution_stack[-1].controller_idx
+        else:
+            my_idx = state.current_player_idx
+
+        scores = [self._score_target(state, target, my_idx) for target in valid_targets]
+        return valid_targets[max(range(len(scores)), key=scores.__getitem__)]
+
+    def _score_target(self, state: 'GameState', target: object, my_idx: int) -> float:
+        """Score a target: positive for opponents' assets, negative for our own."""
+        if isinstance(target, CardInstance):
+            weight = CARD_TYPE_WEIGHTS.get(target.card_type)
+            score = getattr(self.weights, weight) if weight else 0.0
+            owner = state.find_card_owner(target)
+        elif isinstance(target, PlayerState):
+            score = target.unicorn_count()
+            owner = target.player_idx
+        else:
+            return 0.0
+
+        return -score if owner == my_idx else score
 
 
 class EvolutionaryTrainer:
@@ -281,7 +320,8 @@ class EvolutionaryTrainer:
         population_size: int = 20,
         games_per_evaluation: int = 10,
         mutation_rate: float = 0.1,
-        elite_count: int = 4
+        elite_count: int = 4,
+        max_workers: int = 1
     ):
         """Initialize trainer.
 
@@ -290,11 +330,14 @@ class EvolutionaryTrainer:
             games_per_evaluation: Games to play for fitness evaluation
             mutation_rate: Probability of mutating each weight
             elite_count: Number of best agents to keep unchanged
+            max_workers: Processes used to play evaluation games
+                (1 plays them in-process)
         """
         self.population_size = population_size
         self.games_per_evaluation = games_per_evaluation
         self.mutation_rate = mutation_rate
         self.elite_count = elite_count
+        self.max_workers = max_workers
 
         # Initialize population
         self.population: List[EvolutionaryWeights] = [
@@ -344,24 +387,33 @@ class EvolutionaryTrainer:
         return self.population[best_idx]
 
     def _evaluate_population(self) -> List[float]:
-        """Evaluate fitness of each member of the population."""
-        from game.game_engine import GameEngine
-        from players.ai_player import RandomPlayer
-
-        fitness = []
-
-        for weights in self.population:
-            wins = 0
-            player = EvolutionaryPlayer("Evo", weights)
+        """Evaluate fitness of each member of the population.
 
-            for _ in range(self.games_per_evaluation):
-                # Play against random opponent
-                engine = GameEngine(["Evo", "Random"], verbose=False)
-                engine.set_players([player, RandomPlayer("Random")])
-                winner = engine.run_game()
-                if winner == 0:
-                    wins += 1
+        Every game is independent, so all population_size *
+        games_per_evaluation games are spread over a process pool.
+        """
+        jobs = [
+            weights
+            for weights in self.population
+            for _ in range(self.games_per_evaluation)
+        ]
+        # Draw every game's seed here, so fitness doesn't depend on which
+        # process plays which game
+        seeds = [random.getrandbits(64) for _ in jobs]
+
+        if self.max_workers == 1:
+            results = list(map(_play_evaluation_game, jobs, seeds))
+        else:
+            with ProcessPoolExecutor(max_workers=self.max_workers) as executor:
+                results = list(executor.map(
+                    _play_evaluation_game, jobs, seeds,
+                    chunksize=self.games_per_evaluation
+                ))
 
+        fitness = []
+        for i in range(len(self.population)):
+            start = i * self.games_per_evaluation
+            wins = sum(results[start:start + self.games_per_evaluation])
             fitness.append(wins / self.games_per_evaluation)
 
         return fitness
@@ -377,6 +429,65 @@ class EvolutionaryTrainer:
         return winner[1]
 
 
+def _count_threatening(summary: UnicornSummary, player_idx: int, to_win: int) -> int:
+    """Count opponents within 1 unicorn of winning."""
+    # The leading opponent decides whether anyone is threatening at all
+    if summary.max_other[player_idx] < to_win - 1:
+        return 0
+    return sum(
+        1 for other_idx, count in enumerate(summary.counts)
+        if other_idx != player_idx and count >= to_win - 1
+    )
+
+
+def _score_play_card(
+    w: EvolutionaryWeights,
+    card_type: CardType,
+    effect_id: Optional[str],
+    close_to_win: bool,
+    threatening_opponents: int
+) -> float:
+    """Score playing a card from plain values already read off the state.
+
+    Args:
+        w: Weights to score with
+        card_type: Type of the card being played
+        effect_id: Effect of the card being played
+        close_to_win: Whether the card is a unicorn and the player is
+            within 2 unicorns of winning
+        threatening_opponents: Opponents within 1 unicorn of winning
+    """
+    score = 0.0
+
+    # Base score by card type (instants are never played as PLAY_CARD)
+    type_weight = CARD_TYPE_WEIGHTS.get(card_type)
+    if type_weight is not None:
+        score += getattr(w, type_weight)
+
+    # Special card bonuses
+    bonus_weight = EFFECT_BONUS_WEIGHTS.get(effect_id)
+    if bonus_weight is not None:
+        score += getattr(w, bonus_weight)
+
+    # Close to winning bonus
+    if close_to_win:
+        score += w.close_to_win
+
+    # Prioritize defensive/disruption cards when opponents are close to winning
+    if threatening_opponents:
+        score += DISRUPTION_BONUS.get(card_type, 0.0) * threatening_opponents
+
+    return score
+
+
+def _play_evaluation_game(weights: EvolutionaryWeights, seed: int) -> bool:
+    """Play one seeded fitness game against a random opponent; True if it was won."""
+    with seeded_random(seed):
+        engine = GameEngine(["Evo", "Random"], verbose=False)
+        engine.set_players([EvolutionaryPlayer("Evo", weights), RandomPlayer("Random")])
+        return engine.run_game() == 0
+
+
 # Pre-trained weights from running evolutionary training
 # These can be updated by running the trainer
 TRAINED_WEIGHTS = EvolutionaryWeights(
@@ -1,90 +1,143 @@
 """Heuristic evaluation functions for Unstable Unicorns."""
 
-from typing import TYPE_CHECKING
+from functools import lru_cache
+from itertools import chain
+from typing import List, Sequence, Tuple, TYPE_CHECKING
+
+from cards.card import CardType
 
 if TYPE_CHECKING:
     from game.game_state import GameState
 
 
-def evaluate_state(state: 'GameState', player_idx: int) -> float:
-    """Evaluate a game state from a player's perspective.
-
-    Returns a value between 0 and 1, where:
-    - 1.0 = player has won
-    - 0.0 = player has lost
-    - 0.5 = neutral position
+# Per-card bonus for special cards in a player's stable or upgrades
+SPECIAL_CARD_BONUS = {
+    "yay": 0.05,
+    "rainbow_aura": 0.06,
+    "ginormous_unicorn": 0.03,
+    "magical_kittencorn": 0.04,
+}
+
+# Base value of playing a card, by type
+CARD_TYPE_VALUES = {
+    CardType.BABY_UNICORN: 3.0,
+    CardType.BASIC_UNICORN: 4.0,
+    CardType.MAGICAL_UNICORN: 5.0,
+    CardType.UPGRADE: 3.5,
+    CardType.DOWNGRADE: 2.5,
+    CardType.MAGIC: 2.0,
+    CardType.INSTANT: 1.0,  # Instants are reactive
+}
+
+# Flat bonus for playing a card, by effect: high-value cards and draw effects
+CARD_EFFECT_BONUS = {
+    "yay": 2.0,
+    "rainbow_aura": 2.0,
+    "ginormous_unicorn": 2.0,
+    "magical_kittencorn": 2.0,
+    "unicorn_phoenix": 2.0,
+    "greedy_flying_unicorn": 1.0,
+    "unicorn_on_the_cob": 1.0,
+    "good_deal": 1.0,
+}
+
+# Effects worth more when an opponent is ahead
+DESTRUCTION_EFFECTS = frozenset({"unicorn_poison", "two_for_one", "chainsaw_unicorn"})
+
+# Effects that are worth Neighing on sight
+DANGEROUS_EFFECTS = frozenset({
+    "seductive_unicorn",  # Steals unicorns
+    "two_for_one",        # Mass destruction
+    "blatant_thievery",   # Steals from hand
+    "rainbow_lasso",      # Steals unicorn
+})
+
+# Column layout of the feature rows produced by encode_state_features
+FEATURE_NAMES = (
+    "unicorn_count",
+    "other_max",
+    "hand_unicorns",
+    "hand_instants",
+    "hand_magic",
+    "hand_other",
+    "upgrades",
+    "downgrades",
+    "special_bonus",
+)
+
+
+def encode_state_features(state: 'GameState', player_idx: int) -> Tuple[float, ...]:
+    """Encode the parts of a state that evaluate_state depends on.
+
+    The state is walked once; scoring the resulting row is then pure
+    arithmetic, so many rows can be scored together with
+    evaluate_states_batch.
 
     Args:
         state: Current game state
-        player_idx: Index of the player to evaluate for
+        player_idx: Index of the player to encode for
 
     Returns:
-        Evaluation score between 0 and 1
+        Feature row laid out as FEATURE_NAMES
     """
-    # Check terminal states
-    if state.winner == player_idx:
-        return 1.0
-    elif state.winner is not None:
-        return 0.0
-
     player = state.players[player_idx]
-    target = state.unicorns_to_win
-
-    # === Primary factor: Progress toward winning ===
-    unicorn_count = player.unicorn_count()
-    progress = unicorn_count / target
-
-    # === Threat assessment ===
-    other_max = 0
-    for p in state.players:
-        if p.player_idx != player_idx:
-            count = p.unicorn_count()
-            if count > other_max:
-                other_max = count
+    summary = state.unicorn_summary()
 
-    threat = other_max / target
-
-    # === Hand quality ===
-    hand_value = 0.0
+    hand_unicorns = hand_instants = hand_magic = hand_other = 0
     for card in player.hand:
         if card.is_unicorn():
-            hand_value += 0.15
-        elif card.card_type.name == "INSTANT":
-            hand_value += 0.08
-        elif card.card_type.name == "MAGIC":
-            hand_value += 0.05
+            hand_unicorns += 1
+        elif card.card_type == CardType.INSTANT:
+            hand_instants += 1
+        elif card.card_type == CardType.MAGIC:
+            hand_magic += 1
         else:
-            hand_value += 0.03
+            hand_other += 1
+
+    special_bonus = 0.0
+    for card in chain(player.stable, player.upgrades):
+        special_bonus += SPECIAL_CARD_BONUS.get(card.card.effect_id, 0.0)
+
+    return (
+        summary.counts[player_idx],
+        summary.max_other[player_idx],
+        hand_unicorns,
+        hand_instants,
+        hand_magic,
+        hand_other,
+        len(player.upgrades),
+        len(player.downgrades),
+        special_bonus,
+    )
 
-    hand_value = min(hand_value, 0.15)  # Cap contribution
 
-    # === Stable quality ===
-    upgrade_value = len(player.upgrades) * 0.03
-    downgrade_penalty = len(player.downgrades) * 0.04
+@lru_cache(maxsize=100_000)
+def _score_features(features: Tuple[float, ...], target: int) -> float:
+    """Score one encoded, non-terminal state.
 
-    # === Special card bonuses ===
-    special_bonus = 0.0
-    for card in player.stable + player.upgrades:
-        effect_id = card.card.effect_id
-        if effect_id == "yay":
-            special_bonus += 0.05
-        elif effect_id == "rainbow_aura":
-            special_bonus += 0.06
-        elif effect_id == "ginormous_unicorn":
-            special_bonus += 0.03
-        elif effect_id == "magical_kittencorn":
-            special_bonus += 0.04
+    Memoized on the feature row: positions recur constantly across MCTS
+    rollouts, and the row captures everything the score depends on.
+    """
+    (unicorns, other_max, hand_unicorns, hand_instants, hand_magic,
+     hand_other, upgrades, downgrades, special_bonus) = features
+
+    # === Hand quality (capped contribution) ===
+    hand_value = min(
+        hand_unicorns * 0.15 + hand_instants * 0.08 +
+        hand_magic * 0.05 + hand_other * 0.03,
+        0.15
+    )
 
     # === Combine factors ===
     # Progress is the most important (70%)
     # Threat matters (15%)
     # Other factors (15%)
     score = (
-        progress * 0.70 +
-        (1 - threat) * 0.15 +
+        unicorns / target * 0.70 +
+        (1 - other_max / target) * 0.15 +
         hand_value +
-        upgrade_value -
-        downgrade_penalty +
+        upgrades * 0.03 -
+        downgrades * 0.04 +
         special_bonus
     )
 
@@ -92,6 +145,44 @@ def evaluate_state(state: 'GameState', player_idx: int) -> float:
     return max(0.0, min(1.0, score))
 
 
+def evaluate_states_batch(features: Sequence[Sequence[float]], target: int) -> List[float]:
+    """Score a batch of encoded, non-terminal states.
+
+    Args:
+        features: Feature rows from encode_state_features
+        target: Unicorns needed to win
+
+    Returns:
+        One score between 0 and 1 per row
+    """
+    return [_score_features(tuple(row), target) for row in features]
+
+
+def evaluate_state(state: 'GameState', player_idx: int) -> float:
+    """Evaluate a game state from a player's perspective.
+
+    Returns a value between 0 and 1, where:
+    - 1.0 = player has won
+    - 0.0 = player has lost
+    - 0.5 = neutral position
+
+    Args:
+        state: Current game state
+        player_idx: Index of the player to evaluate for
+
+    Returns:
+        Evaluation score between 0 and 1
+    """
+    # Check terminal states
+    if state.winner == player_idx:
+        return 1.0
+    elif state.winner is not None:
+        return 0.0
+
+    features = encode_state_features(state, player_idx)
+    return evaluate_states_batch((features,), state.unicorns_to_win)[0]
+
+
 def evaluate_card_value(state: 'GameState', card, player_idx: int) -> float:
     """Evaluate the value of playing a specific card.
 
@@ -103,22 +194,11 @@ def evaluate_card_value(state: 'GameState', card, player_idx: int) -> float:
     Returns:
         Value score for playing this card
     """
-    from cards.card import CardType
-
     player = state.players[player_idx]
     score = 0.0
 
     # Base value by type
-    type_values = {
-        CardType.BABY_UNICORN: 3.0,
-        CardType.BASIC_UNICORN: 4.0,
-        CardType.MAGICAL_UNICORN: 5.0,
-        CardType.UPGRADE: 3.5,
-        CardType.DOWNGRADE: 2.5,
-        CardType.MAGIC: 2.0,
-        CardType.INSTANT: 1.0,  # Instants are reactive
-    }
-    score += type_values.get(card.card_type, 1.0)
+    score += CARD_TYPE_VALUES.get(card.card_type, 1.0)
 
     # Unicorns more valuable when close to winning
     if card.is_unicorn():
@@ -131,24 +211,13 @@ def evaluate_card_value(state: 'GameState', card, player_idx: int) -> float:
     # Special card bonuses
     effect_id = card.card.effect_id
     if effect_id:
-        high_value_effects = [
-            "yay", "rainbow_aura", "ginormous_unicorn",
-            "magical_kittencorn", "unicorn_phoenix"
-        ]
-        if effect_id in high_value_effects:
-            score += 2.0
-
-        # Draw effects are good
-        draw_effects = ["greedy_flying_unicorn", "unicorn_on_the_cob", "good_deal"]
-        if effect_id in draw_effects:
-            score += 1.0
+        score += CARD_EFFECT_BONUS.get(effect_id, 0.0)
 
         # Destruction effects value depends on game state
-        destruction_effects = ["unicorn_poison", "two_for_one", "chainsaw_unicorn"]
-        if effect_id in destruction_effects:
+        if effect_id in DESTRUCTION_EFFECTS:
             # More valuable if opponent is ahead
-            other_max = max(p.unicorn_count() for p in state.players if p.player_idx != player_idx)
-            if other_max >= player.unicorn_count():
+            summary = state.unicorn_summary()
+            if summary.max_other[player_idx] >= summary.counts[player_idx]:
                 score += 2.0
 
     return score
@@ -169,8 +238,6 @@ def should_neigh(state: 'GameState', player_idx: int) -> float:
     Returns:
         Recommendation score
     """
-    from cards.card import CardType
-
     player = state.players[player_idx]
     card_being_played = state.card_being_played
 
@@ -209,13 +276,7 @@ def should_neigh(state: 'GameState', player_idx: int) -> float:
 
     # Consider special cards
     if card_being_played.card.effect_id:
-        dangerous_effects = [
-            "seductive_unicorn",  # Steals unicorns
-            "two_for_one",        # Mass destruction
-            "blatant_thievery",   # Steals from hand
-            "rainbow_lasso",      # Steals unicorn
-        ]
-        if card_being_played.card.effect_id in dangerous_effects:
+        if card_being_played.card.effect_id in DANGEROUS_EFFECTS:
             score += 1.5
 
     return score
@@ -2,45 +2,110 @@
 
 import math
 import random
-from dataclasses import dataclass
+from bisect import bisect
+from concurrent.futures import ProcessPoolExecutor
+from itertools import accumulate, repeat
 from typing import Optional, List, Dict, Tuple
+from cards.card import CardType
 from game.game_state import GameState
-from game.action import Action, get_legal_actions, apply_action
-from ai.evolutionary import EvolutionaryWeights, TRAINED_WEIGHTS
+from game.action import Action, ActionType, get_legal_actions, apply_action
+from ai.evolutionary import CARD_TYPE_WEIGHTS, EvolutionaryWeights, TRAINED_WEIGHTS
 from ai.heuristics import evaluate_state
+from ai.simulation import seeded_random
+
+# Rollouts stop once the player to act is one unicorn from winning and
+# score that player as this close to a win
+ROLLOUT_NEAR_WIN_VALUE = 0.9
+# From this depth on, rollouts stop once the leader is ROLLOUT_LEAD_MARGIN
+# unicorns ahead of everyone else; the heuristic evaluation takes over
+ROLLOUT_LEAD_MIN_DEPTH = 5
+ROLLOUT_LEAD_MARGIN = 3
 
 
-@dataclass
 class HybridNode:
-    """Node in the hybrid MCTS tree."""
-    state: GameState
+    """Node in the hybrid MCTS tree.
+
+    A node keeps its state only while it still has untried actions to
+    expand from (or is terminal); fully expanded nodes drop it.
+    """
+    state: Optional[GameState]
     parent: Optional['HybridNode']
     action: Optional[Action]
-    children: Dict[str, 'HybridNode']
+    children: List['HybridNode']  # In expansion order
     visits: int
     total_value: float
     untried_actions: List[Action]
+    untried_weights: Optional[List[float]]  # Prior per untried action, built on first expansion
+    untried_cum: Optional[List[float]]  # Running sums of untried_weights, patched on removal
+    terminal: bool
     player_idx: int
     prior_probability: float  # From evolutionary heuristics
+    inv_sqrt_visits: float  # 1 / sqrt(visits), kept current by update()
+    inv_one_plus_visits: float  # 1 / (1 + visits), kept current by update()
+
+    # Searches allocate many nodes; slots drop the per-node __dict__
+    __slots__ = ('state', 'parent', 'action', 'children', 'visits', 'total_value',
+                 'untried_actions', 'untried_weights', 'untried_cum', 'terminal', 'player_idx',
+                 'prior_probability', 'inv_sqrt_visits', 'inv_one_plus_visits')
 
     def __init__(self, state: GameState, parent: Optional['HybridNode'] = None,
                  action: Optional[Action] = None, player_idx: int = 0,
-                 prior_probability: float = 1.0):
+                 prior_probability: float = 1.0,
+                 legal_actions: Optional[List[Action]] = None):
         self.state = state
         self.parent = parent
         self.action = action
-        self.children = {}
+        self.children = []
         self.visits = 0
         self.total_value = 0.0
         self.player_idx = player_idx
         self.prior_probability = prior_probability
-        self.untried_actions = get_legal_actions(state) if not state.is_game_over() else []
+        self.inv_sqrt_visits = 0.0
+        self.inv_one_plus_visits = 1.0
+        self.terminal = state.is_game_over()
+        if self.terminal:
+            self.untried_actions = []
+        elif legal_actions is not None:
+            self.untried_actions = list(legal_actions)  # Expansion consumes this list
+        else:
+            self.untried_actions = get_legal_actions(state)
+        self.untried_weights = None
+        self.untried_cum = None
 
     @property
     def value(self) -> float:
         """Average value of this node."""
         return self.total_value / self.visits if self.visits > 0 else 0.0
 
+    def remove_untried(self, idx: int) -> None:
+        """Drop an expanded action, keeping its weight and running sums in step.
+
+        The last action moves into ``idx``, so only the running sums from
+        ``idx`` on change, by the weight difference between the two.
+        """
+        weights = self.untried_weights
+        removed = weights[idx]
+        _swap_remove(self.untried_actions, idx)
+        _swap_remove(weights, idx)
+
+        cum = self.untried_cum
+        cum.pop()
+        if idx < len(weights):
+            delta = weights[idx] - removed
+            for i in range(idx, len(cum)):
+                cum[i] += delta
+
+    def update(self, value: float):
+        """Record one visit with the given rollout value.
+
+        Also refreshes the visit-derived factors that select_child reads,
+        so selection does no square roots or divisions for them per child.
+        """
+        self.visits += 1
+        self.total_value += value
+        self.inv_sqrt_visits = 1.0 / math.sqrt(self.visits)
+        self.inv_one_plus_visits = 1.0 / (1 + self.visits)
+
     def ucb1_with_prior(self, exploration: float = 1.414, prior_weight: float = 0.5) -> float:
         """UCB1 formula enhanced with prior probability from evolutionary heuristics."""
         if self.visits == 0:
@@ -52,9 +117,34 @@ class HybridNode:
 
         return exploitation + exploration_term + prior_bonus
 
-    def select_child(self, exploration: float = 1.414) -> 'HybridNode':
-        """Select child using UCB1 with prior."""
-        return max(self.children.values(), key=lambda c: c.ucb1_with_prior(exploration))
+    def select_child(self, exploration: float = 1.414, prior_weight: float = 0.5) -> 'HybridNode':
+        """Select child using UCB1 with prior.
+
+        Scores all children in one pass. The exploration constant and the
+        parent's log visit count are folded into one factor up front, and
+        each child's visit-derived factors come from update(), so the score
+        per child is one division plus a few multiply-adds. Picks the same
+        child as maximizing ``ucb1_with_prior`` (first one wins ties).
+        """
+        explore_scale = 0.0
+        if self.visits > 0:
+            explore_scale = exploration * math.sqrt(math.log(self.visits))
+        best_child = None
+        best_score = float('-inf')
+
+        for child in self.children:
+            visits = child.visits
+            if visits == 0:
+                return child  # Unvisited children score infinity
+
+            score = (child.total_value / visits
+                     + explore_scale * child.inv_sqrt_visits
+                     + prior_weight * child.prior_probability * child.inv_one_plus_visits)
+            if score > best_score:
+                best_score = score
+                best_child = child
+
+        return best_child
 
     def is_fully_expanded(self) -> bool:
         """Check if all actions have been tried."""
@@ -62,7 +152,7 @@ class HybridNode:
 
     def is_terminal(self) -> bool:
         """Check if this is a terminal node."""
-        return self.state.is_game_over()
+        return self.terminal
 
 
 class HybridMCTS:
@@ -79,13 +169,30 @@ class HybridMCTS:
     def __init__(self, iterations: int = 500, determinizations: int = 5,
                  weights: Optional[EvolutionaryWeights] = None,
                  exploration: float = 1.414, prior_weight: float = 0.5,
-                 rollout_depth: int = 30):
+                 rollout_depth: int = 30, leaf_rollouts: int = 1,
+                 max_workers: int = 1):
         self.iterations = iterations
         self.determinizations = determinizations
         self.weights = weights or TRAINED_WEIGHTS
         self.exploration = exploration
         self.prior_weight = prior_weight
         self.rollout_depth = rollout_depth
+        self.leaf_rollouts = leaf_rollouts  # Rollouts averaged per expanded leaf
+        self.max_workers = max_workers  # Processes for determinizations (1 runs in-process)
+
+        # Weight for playing each card type (instants are only ever Neighed)
+        self._card_weight_by_type = {
+            card_type: getattr(self.weights, name)
+            for card_type, name in CARD_TYPE_WEIGHTS.items()
+            if card_type != CardType.INSTANT
+        }
+
+        # Action types without a scorer score 0
+        self._action_scorers = {
+            ActionType.PLAY_CARD: self._score_play,
+            ActionType.NEIGH: self._score_neigh,
+            ActionType.END_ACTION_PHASE: self._score_end_action,
+        }
 
     def compute_action_priors(self, state: GameState, actions: List[Action],
                               player_idx: int) -> Dict[str, float]:
@@ -93,55 +200,63 @@ class HybridMCTS:
         if not actions:
             return {}
 
-        scores = {}
-        for action in actions:
-            score = self._evaluate_action(state, action, player_idx)
-            scores[self._action_key(action)] = score
-
-        # Convert scores to probabilities using softmax
-        if not scores:
-            return {}
+        scores = {
+            self._action_key(action): score
+            for action, score in zip(actions, self._score_actions(state, actions, player_idx))
+        }
 
+        # Convert scores to probabilities using a stable softmax, normalizing
+        # in place rather than building another dict
         max_score = max(scores.values())
-        exp_scores = {k: math.exp(v - max_score) for k, v in scores.items()}
-        total = sum(exp_scores.values())
-
-        return {k: v / total for k, v in exp_scores.items()}
+        for key, score in scores.items():
+            scores[key] = math.exp(score - max_score)
+        total = sum(scores.values())
+        for key, weight in scores.items():
+            scores[key] = weight / total
+
+        return scores
+
+    def _score_actions(self, state: GameState, actions: List[Action],
+                       player_idx: int) -> List[float]:
+        """Evaluate every action in a list against the same state.
+
+        A Neigh's score depends only on the state and the card being played,
+        so the threat is assessed once and shared by every Neigh action.
+        """
+        scores = []
+        neigh_score = None
+        for action in actions:
+            if action.action_type == ActionType.NEIGH:
+                if neigh_score is None:
+                    neigh_score = self._score_neigh(state, action, player_idx)
+                scores.append(neigh_score)
+            else:
+                scores.append(self._evaluate_action(state, action, player_idx))
+        return scores
 
     def _evaluate_action(self, state: GameState, action: Action, player_idx: int) -> float:
         """Evaluate an action using evolutionary weights."""
-        from game.action import ActionType
-
-        score = 0.0
-
-        if action.action_type == ActionType.PLAY_CARD and action.card:
-            card = action.card
-
-            # Card type bonuses from evolutionary weights
-            if card.is_unicorn():
-                if card.card_type.name == 'MAGICAL_UNICORN':
-                    score += self.weights.magical_unicorn
-                elif card.card_type.name == 'BABY_UNICORN':
-                    score += self.weights.baby_unicorn
-                else:
-                    score += self.weights.basic_unicorn
-            elif card.card_type.name == 'UPGRADE':
-                score += self.weights.upgrade
-            elif card.card_type.name == 'DOWNGRADE':
-                score += self.weights.downgrade
-            elif card.card_type.name == 'MAGIC':
-                score += self.weights.magic
+        scorer = self._action_scorers.get(action.action_type)
+        if scorer is None:
+            return 0.0
+        return scorer(state, action, player_idx)
 
-        elif action.action_type == ActionType.NEIGH:
-            # Evaluate whether to neigh based on card being played
-            if state.card_being_played:
-                threat = self._evaluate_threat(state.card_being_played, state, player_idx)
-                score += threat * self.weights.neigh_value
+    def _score_play(self, state: GameState, action: Action, player_idx: int) -> float:
+        """Score playing a card by its type's evolutionary weight."""
+        if not action.card:
+            return 0.0
+        return self._card_weight_by_type.get(action.card.card_type, 0.0)
 
-        elif action.action_type == ActionType.END_ACTION_PHASE:
-            score += self.weights.end_action_penalty
+    def _score_neigh(self, state: GameState, action: Action, player_idx: int) -> float:
+        """Score Neighing by how threatening the card being played is."""
+        if not state.card_being_played:
+            return 0.0
+        threat = self._evaluate_threat(state.card_being_played, state, player_idx)
+        return threat * self.weights.neigh_value
 
-        return score
+    def _score_end_action(self, state: GameState, action: Action, player_idx: int) -> float:
+        """Score ending the action phase."""
+        return self.weights.end_action_penalty
 
     def _evaluate_threat(self, card, state: GameState, player_idx: int) -> float:
         """Evaluate how threatening a card is."""
@@ -158,16 +273,14 @@ class HybridMCTS:
                         threat += 1.0
 
         # Magical unicorns are more threatening
-        if card.card_type.name == 'MAGICAL_UNICORN':
+        if card.card_type == CardType.MAGICAL_UNICORN:
             threat += 0.5
 
         return threat
 
     def _action_key(self, action: Action) -> str:
         """Create a unique key for an action."""
-        if action.card:
-            return f"{action.action_type.name}_{action.card.instance_id}"
-        return action.action_type.name
+        return action.search_key()
 
     def search(self, root_state: GameState, player_idx: int) -> Action:
         """Run hybrid MCTS search and return best action."""
@@ -178,17 +291,46 @@ class HybridMCTS:
         if len(actions) == 1:
             return actions[0]
 
-        # Aggregate action scores across determinizations
-        action_scores: Dict[str, Tuple[float, int, Action]] = {}
+        action_scores = self._root_statistics(root_state, player_idx)
 
-        for _ in range(self.determinizations):
-            # Determinize hidden information
-            det_state = root_state.determinize_for_player(player_idx)
+        # Select best action by visit count (more robust than value)
+        if not action_scores:
+            return random.choice(actions)
 
-            # Run MCTS iterations
-            scores = self._run_iterations(det_state, player_idx)
+        best_key = max(action_scores.keys(), key=lambda k: action_scores[k][1])
+        best_action = action_scores[best_key][2]
+
+        # Hand back the caller's own action object (worker results are copies)
+        return next((action for action in actions if action == best_action), best_action)
+
+    def _root_statistics(self, root_state: GameState,
+                         player_idx: int) -> Dict[str, Tuple[float, int, Action]]:
+        """Search every determinization and sum their root statistics per action key."""
+        # Determinize hidden information once per tree and seed each tree's
+        # search up front, as MCTS._root_statistics does
+        det_states = [
+            root_state.determinize_for_player(player_idx)
+            for _ in range(self.determinizations)
+        ]
+        seeds = [random.getrandbits(64) for _ in det_states]
+
+        # Each determinization grows an independent tree, so they can be
+        # searched in separate processes and merged at the root
+        if self.max_workers == 1:
+            results = map(_run_determinization, repeat(self), det_states,
+                          repeat(player_idx), seeds)
+        else:
+            workers = min(self.max_workers, self.determinizations)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(
+                    _run_determinization, repeat(self), det_states,
+                    repeat(player_idx), seeds
+                ))
+
+        # Aggregate action scores across determinizations
+        action_scores: Dict[str, Tuple[float, int, Action]] = {}
 
-            # Aggregate scores
+        for scores in results:
             for key, (score, visits, action) in scores.items():
                 if key in action_scores:
                     old_score, old_visits, _ = action_scores[key]
@@ -196,12 +338,7 @@ class HybridMCTS:
                 else:
                     action_scores[key] = (score, visits, action)
 
-        # Select best action by visit count (more robust than value)
-        if not action_scores:
-            return random.choice(actions)
-
-        best_key = max(action_scores.keys(), key=lambda k: action_scores[k][1])
-        return action_scores[best_key][2]
+        return action_scores
 
     def _run_iterations(self, state: GameState, player_idx: int) -> Dict[str, Tuple[float, int, Action]]:
         """Run MCTS iterations on a determinized state."""
@@ -209,20 +346,21 @@ class HybridMCTS:
         actions = get_legal_actions(state)
         priors = self.compute_action_priors(state, actions, player_idx)
 
-        root = HybridNode(state, player_idx=player_idx)
+        root = HybridNode(state, player_idx=player_idx, legal_actions=actions)
 
         for _ in range(self.iterations):
             node = root
 
-            # Selection
-            while node.is_fully_expanded() and not node.is_terminal():
-                node = node.select_child(self.exploration)
+            # Selection (reads the node flags directly, once per tree level)
+            while not node.untried_actions and not node.terminal:
+                node = node.select_child(self.exploration, self.prior_weight)
 
             # Expansion
-            if not node.is_terminal() and node.untried_actions:
-                action = self._select_untried_action(node, priors)
+            if not node.terminal and node.untried_actions:
+                action, idx = self._select_untried_action(node, priors)
+                key = self._action_key(action)
                 new_state = apply_action(node.state.copy(), action)
-                prior = priors.get(self._action_key(action), 1.0 / len(node.untried_actions))
+                prior = priors.get(key, 1.0 / len(node.untried_actions))
 
                 child = HybridNode(
                     new_state,
@@ -231,52 +369,89 @@ class HybridMCTS:
                     player_idx=player_idx,
                     prior_probability=prior
                 )
-                node.children[self._action_key(action)] = child
-                node.untried_actions.remove(action)
+                node.children.append(child)
+                node.remove_untried(idx)
+                if not node.untried_actions:
+                    node.state = None  # Nothing left to expand from it
                 node = child
 
-            # Simulation (rollout with heuristic cutoff)
-            value = self._simulate(node.state, player_idx)
+            # Simulation (rollouts with heuristic cutoff, averaged at the leaf).
+            # A freshly expanded leaf's untried actions are its legal actions.
+            leaf_actions = node.untried_actions if not node.children else None
+            value = sum(
+                self._simulate(node.state, player_idx, leaf_actions)
+                for _ in range(self.leaf_rollouts)
+            ) / self.leaf_rollouts
 
             # Backpropagation
             while node is not None:
-                node.visits += 1
-                node.total_value += value
+                node.update(value)
                 node = node.parent
 
-        # Collect results
+        # Collect results, merging root children whose actions share a key
         results = {}
-        for key, child in root.children.items():
-            results[key] = (child.total_value, child.visits, child.action)
+        for child in root.children:
+            key = self._action_key(child.action)
+            if key in results:
+                total_value, visits, action = results[key]
+                results[key] = (total_value + child.total_value, visits + child.visits, action)
+            else:
+                results[key] = (child.total_value, child.visits, child.action)
 
         return results
 
-    def _select_untried_action(self, node: HybridNode, priors: Dict[str, float]) -> Action:
-        """Select an untried action, biased by prior probabilities."""
+    def _select_untried_action(self, node: HybridNode,
+                               priors: Dict[str, float]) -> Optional[Tuple[Action, int]]:
+        """Select an untried action, biased by prior probabilities.
+
+        Returns:
+            The action and its index in ``node.untried_actions``
+        """
         if not node.untried_actions:
             return None
 
-        # Weight untried actions by their priors
-        weights = []
-        for action in node.untried_actions:
-            key = self._action_key(action)
-            weight = priors.get(key, 0.1)
-            weights.append(weight)
+        # Weight untried actions by their priors, looked up once per node
+        if node.untried_weights is None:
+            node.untried_weights = [
+                priors.get(self._action_key(action), 0.1)
+                for action in node.untried_actions
+            ]
+            node.untried_cum = list(accumulate(node.untried_weights))
 
-        total = sum(weights)
+        cum_weights = node.untried_cum
+        total = cum_weights[-1]
         if total == 0:
-            return random.choice(node.untried_actions)
-
-        weights = [w / total for w in weights]
-        return random.choices(node.untried_actions, weights=weights, k=1)[0]
-
-    def _simulate(self, state: GameState, player_idx: int) -> float:
-        """Simulate game with heuristic-guided rollout."""
+            idx = random.randrange(len(node.untried_actions))
+        else:
+            idx = bisect(cum_weights, random.random() * total, 0, len(cum_weights) - 1)
+        return node.untried_actions[idx], idx
+
+    def _simulate(self, state: GameState, player_idx: int,
+                  actions: Optional[List[Action]] = None) -> float:
+        """Simulate game with heuristic-guided rollout.
+
+        Args:
+            state: State to roll out from (left unmodified)
+            player_idx: Player whose value is returned
+            actions: Legal actions in ``state``, if already known
+        """
         sim_state = state.copy()
         depth = 0
 
         while not sim_state.is_game_over() and depth < self.rollout_depth:
-            actions = get_legal_actions(sim_state)
+            if depth >= 1:
+                to_act = sim_state.current_player
+                if (not to_act.unicorns_are_pandas
+                        and to_act.unicorn_count() >= sim_state.unicorns_to_win - 1):
+                    if to_act.player_idx == player_idx:
+                        return ROLLOUT_NEAR_WIN_VALUE
+                    return 1.0 - ROLLOUT_NEAR_WIN_VALUE
+
+            if depth >= ROLLOUT_LEAD_MIN_DEPTH and _leader_margin(sim_state) >= ROLLOUT_LEAD_MARGIN:
+                break
+
+            if actions is None:
+                actions = get_legal_actions(sim_state)
             if not actions:
                 break
 
@@ -287,6 +462,7 @@ class HybridMCTS:
                 action = random.choice(actions)
 
             sim_state = apply_action(sim_state, action)
+            actions = None
             depth += 1
 
         # Evaluate final state
@@ -304,8 +480,7 @@ class HybridMCTS:
         best_action = actions[0]
         best_score = float('-inf')
 
-        for action in actions:
-            score = self._evaluate_action(state, action, current_player)
+        for action, score in zip(actions, self._score_actions(state, actions, current_player)):
             # Add small random noise to break ties
             score += random.random() * 0.01
             if score > best_score:
@@ -315,6 +490,32 @@ class HybridMCTS:
         return best_action
 
 
+def _leader_margin(state: GameState) -> int:
+    """Unicorns the leading player is ahead of the runner-up."""
+    best = second = 0
+    for player in state.players:
+        count = player.unicorn_count()
+        if count > best:
+            best, second = count, best
+        elif count > second:
+            second = count
+    return best - second
+
+
+def _swap_remove(items: list, idx: int) -> None:
+    """Remove items[idx] in O(1) by moving the last item into its slot."""
+    last = items.pop()
+    if idx < len(items):
+        items[idx] = last
+
+
+def _run_determinization(hybrid: HybridMCTS, state: GameState, player_idx: int,
+                         seed: int) -> Dict[str, Tuple[float, int, Action]]:
+    """Seed and search one determinized state; module-level so worker processes can run it."""
+    with seeded_random(seed):
+        return hybrid._run_iterations(state, player_idx)
+
+
 class HybridPlayer:
     """Player that uses hybrid MCTS + Evolutionary AI."""
 
@@ -372,7 +573,7 @@ class HybridPlayer:
 
             for target in targets:
                 if hasattr(target, 'is_unicorn') and target.is_unicorn():
-                    score = 2.0 if target.card_type.name == 'MAGICAL_UNICORN' else 1.0
+                    score = 2.0 if target.card_type == CardType.MAGICAL_UNICORN else 1.0
                     if score > best_score:
                         best_score = score
                         best_target = target
@@ -394,13 +595,13 @@ class HybridPlayer:
                 # Own card - negative value to destroy
                 if target in player.stable:
                     value = -1.0
-                    if target.card_type.name == 'MAGICAL_UNICORN':
+                    if target.card_type == CardType.MAGICAL_UNICORN:
                         value = -2.0
             else:
                 # Opponent card - positive value to destroy
                 if target in player.stable:
                     value = 1.0
-                    if target.card_type.name == 'MAGICAL_UNICORN':
+                    if target.card_type == CardType.MAGICAL_UNICORN:
                         value = 2.0
                     # Extra value if opponent is close to winning
                     if player.unicorn_count() >= state.unicorns_to_win - 2:
@@ -9,17 +9,24 @@ Based on: "Information Set Monte Carlo Tree Search" by Cowling, Powley, Whitehou
 
 import math
 import random
-from dataclasses import dataclass, field
 from typing import Dict, List, Optional, Set, Tuple, TYPE_CHECKING
 
+from cards.card import CardType
+from game.action import Action, ActionType, get_legal_actions, apply_action
 from players.player import Player
 
 if TYPE_CHECKING:
     from game.game_state import GameState
-    from game.action import Action
+
+# Rollout policy score for playing each card type
+ROLLOUT_PLAY_SCORES: Dict[CardType, float] = {
+    CardType.BASIC_UNICORN: 2.0,
+    CardType.MAGICAL_UNICORN: 2.0,
+    CardType.BABY_UNICORN: 2.0,
+    CardType.MAGIC: 1.0,
+}
 
 
-@dataclass
 class ISMCTSNode:
     """Node in the ISMCTS tree.
 
@@ -27,17 +34,35 @@ class ISMCTSNode:
     acting player knows) rather than complete game states.
     """
     player_idx: int  # Player who acts at this node
-    parent: Optional['ISMCTSNode'] = None
-    parent_action: Optional['Action'] = None
-    children: Dict[str, 'ISMCTSNode'] = field(default_factory=dict)  # action_key -> node
+    parent: Optional['ISMCTSNode']
+    parent_action: Optional['Action']
+    children: Dict[str, 'ISMCTSNode']  # action_key -> node
 
     # Statistics
-    visits: int = 0
-    total_value: float = 0.0
-    availability_count: int = 0  # Times this node was available
+    visits: int
+    total_value: float
+    availability_count: int  # Times this node was available
 
     # Actions that lead to this node (for availability tracking)
-    incoming_actions: Set[str] = field(default_factory=set)
+    incoming_actions: Set[str]
+
+    __slots__ = ('player_idx', 'parent', 'parent_action', 'children', 'visits',
+                 'total_value', 'availability_count', 'incoming_actions')
+
+    def __init__(self, player_idx: int, parent: Optional['ISMCTSNode'] = None,
+                 parent_action: Optional['Action'] = None,
+                 children: Optional[Dict[str, 'ISMCTSNode']] = None,
+                 visits: int = 0, total_value: float = 0.0,
+                 availability_count: int = 0,
+                 incoming_actions: Optional[Set[str]] = None):
+        self.player_idx = player_idx
+        self.parent = parent
+        self.parent_action = parent_action
+        self.children = children if children is not None else {}
+        self.visits = visits
+        self.total_value = total_value
+        self.availability_count = availability_count
+        self.incoming_actions = incoming_actions if incoming_actions is not None else set()
 
     @property
     def value(self) -> float:
@@ -86,6 +111,11 @@ class ISMCTS:
         self.exploration = exploration
         self.rollout_depth = rollout_depth
 
+        # Nodes of the current search keyed by (depth, the searching
+        # player's information set), so transpositions share statistics.
+        # Keying on depth keeps the shared tree acyclic.
+        self._transpositions: Dict[Tuple[int, tuple], ISMCTSNode] = {}
+
     def search(self, state: 'GameState', player_idx: int) -> 'Action':
         """Search for the best action using ISMCTS.
 
@@ -96,8 +126,6 @@ class ISMCTS:
         Returns:
             Best action found
         """
-        from game.action import get_legal_actions
-
         # Get initial legal actions
         actions = get_legal_actions(state)
         if len(actions) <= 1:
@@ -105,6 +133,7 @@ class ISMCTS:
 
         # Create root node
         root = ISMCTSNode(player_idx=state.current_player_idx)
+        self._transpositions = {}
 
         for _ in range(self.iterations):
             # Create a determinization for this iteration
@@ -124,83 +153,117 @@ class ISMCTS:
         perspective_player: int
     ) -> None:
         """Run one iteration of ISMCTS."""
-        from game.action import get_legal_actions, apply_action
-
         node = root
         state = state.copy()
-        path: List[Tuple[ISMCTSNode, str]] = []
+        path: List[ISMCTSNode] = []  # Nodes entered below the root
 
         # Selection phase
         while True:
+            if state.is_game_over():
+                break
             actions = get_legal_actions(state)
-            if not actions or state.is_game_over():
+            if not actions:
                 break
 
             action_keys = [self._action_key(a) for a in actions]
 
-            # Update availability for existing children
-            for key in action_keys:
-                if key in node.children:
-                    node.children[key].availability_count += 1
-
-            # Check for unexplored actions
-            unexplored = [
-                (a, k) for a, k in zip(actions, action_keys)
-                if k not in node.children
-            ]
+            # Update availability for existing children and collect the
+            # unexplored actions in the same pass
+            children = node.children
+            unexplored = []
+            for action, key in zip(actions, action_keys):
+                child = children.get(key)
+                if child is None:
+                    unexplored.append((action, key))
+                else:
+                    child.availability_count += 1
 
             if unexplored:
                 # Expansion: add a new child
                 action, key = random.choice(unexplored)
-                child = ISMCTSNode(
-                    player_idx=state.get_next_player_idx() if action.action_type.name != "NEIGH" else state.current_player_idx,
-                    parent=node,
-                    parent_action=action
-                )
-                child.availability_count = 1
-                node.children[key] = child
-                path.append((node, key))
-
+                next_player_idx = state.get_next_player_idx() if action.action_type != ActionType.NEIGH else state.current_player_idx
                 state = apply_action(state, action)
+
+                # Reuse the node of an information set reached at this
+                # depth by another action order. A shared node keeps the
+                # parent it was created under, so backpropagation follows
+                # this iteration's path rather than parent links.
+                tt_key = (len(path) + 1, state.info_set_key(perspective_player))
+                child = self._transpositions.get(tt_key)
+                if child is None:
+                    child = ISMCTSNode(
+                        player_idx=next_player_idx,
+                        parent=node,
+                        parent_action=action
+                    )
+                    self._transpositions[tt_key] = child
+                child.availability_count += 1
+                children[key] = child
+                path.append(child)
+
                 node = child
                 break
             else:
-                # Selection: choose among available children
-                available_children = [
-                    (node.children[k], k, a)
-                    for a, k in zip(actions, action_keys)
-                    if k in node.children
-                ]
-
-                if not available_children:
-                    break
-
-                # Select using UCB1
-                best_child, best_key, best_action = max(
-                    available_children,
-                    key=lambda x: x[0].ucb1(self.exploration)
+                # Selection: every action has a child here, so score them
+                # all with UCB1 in one pass (first one wins ties)
+                best_action, best_child = self._select_ucb1(
+                    node, actions, action_keys
                 )
+                if best_child is None:
+                    break
 
-                path.append((node, best_key))
+                path.append(best_child)
                 state = apply_action(state, best_action)
                 node = best_child
 
         # Rollout phase
         value = self._rollout(state, perspective_player)
 
-        # Backpropagation
-        for parent_node, action_key in path:
-            child = parent_node.children[action_key]
+        # Backpropagation along the nodes this iteration passed through
+        for child in path:
             child.visits += 1
             child.total_value += value
 
         # Update root
         root.visits += 1
 
+    def _select_ucb1(
+        self,
+        node: ISMCTSNode,
+        actions: List['Action'],
+        action_keys: List[str]
+    ) -> Tuple[Optional['Action'], Optional[ISMCTSNode]]:
+        """Pick the available child with the highest UCB1 score.
+
+        Equivalent to maximizing ``ISMCTSNode.ucb1`` over the available
+        children, without building an intermediate list or a call per child.
+        """
+        children = node.children
+        exploration = self.exploration
+        best: Tuple[Optional['Action'], Optional[ISMCTSNode]] = (None, None)
+        best_score = float('-inf')
+
+        for action, key in zip(actions, action_keys):
+            child = children.get(key)
+            if child is None:
+                continue
+
+            visits = child.visits
+            availability = child.availability_count
+            if visits == 0 or availability == 0:
+                return action, child  # Unvisited children score infinity
+
+            score = child.total_value / visits + exploration * math.sqrt(
+                math.log(availability) / visits
+            )
+            if score > best_score:
+                best_score = score
+                best = (action, child)
+
+        return best
+
     def _rollout(self, state: 'GameState', player_idx: int) -> float:
         """Perform a random rollout and return value for player."""
-        from game.action import get_legal_actions, apply_action
-
         state = state.copy()
         depth = 0
 
@@ -226,46 +289,36 @@ class ISMCTS:
 
         Uses a mix of random and heuristic selection.
         """
-        from game.action import ActionType
-
         # 70% random, 30% heuristic
         if random.random() < 0.7:
             return random.choice(actions)
 
-        # Simple heuristics
-        scores = []
-        for action in actions:
-            score = 0.0
-
-            if action.action_type == ActionType.PLAY_CARD:
-                if action.card.is_unicorn():
-                    score += 2.0
-                if action.card.card_type.name == "MAGIC":
-                    score += 1.0
-
-            elif action.action_type == ActionType.NEIGH:
-                if state.card_being_played and state.card_being_played.is_unicorn():
-                    score += 1.5
+        # Simple heuristics (every Neigh counters the same card)
+        neigh_score = 0.0
+        if state.card_being_played and state.card_being_played.is_unicorn():
+            neigh_score = 1.5
 
-            elif action.action_type == ActionType.END_ACTION_PHASE:
-                score -= 0.5
-
-            scores.append(score)
-
-        # Softmax selection
-        max_score = max(scores)
-        exp_scores = [math.exp(s - max_score) for s in scores]
-        total = sum(exp_scores)
-        probs = [e / total for e in exp_scores]
+        # Sample from the softmax of the scores in one pass with the
+        # Gumbel-max trick: argmax(score + Gumbel noise)
+        best_action = actions[-1]
+        best_key = float('-inf')
+        for action in actions:
+            action_type = action.action_type
+            if action_type == ActionType.PLAY_CARD:
+                score = ROLLOUT_PLAY_SCORES.get(action.card.card_type, 0.0)
+            elif action_type == ActionType.NEIGH:
+                score = neigh_score
+            elif action_type == ActionType.END_ACTION_PHASE:
+                score = -0.5
+            else:
+                score = 0.0
 
-        r = random.random()
-        cumsum = 0.0
-        for action, prob in zip(actions, probs):
-            cumsum += prob
-            if r <= cumsum:
-                return action
+            key = score + _gumbel()
+            if key > best_key:
+                best_key = key
+                best_action = action
 
-        return actions[-1]
+        return best_action
 
     def _evaluate(self, state: 'GameState', player_idx: int) -> float:
         """Evaluate terminal or near-terminal state."""
@@ -323,6 +376,14 @@ class ISMCTS:
         return best_action
 
 
+def _gumbel() -> float:
+    """Draw a standard Gumbel variate."""
+    u = random.random()
+    while u == 0.0:  # random() can return exactly 0, where log is undefined
+        u = random.random()
+    return -math.log(-math.log(u))
+
+
 class ISMCTSPlayer(Player):
     """Player using Information Set MCTS."""
 
@@ -5,24 +5,53 @@ Uses determinization to handle hidden information (opponent hands).
 
 import math
 import random
-from dataclasses import dataclass, field
-from typing import Dict, List, Optional, TYPE_CHECKING
+from concurrent.futures import ProcessPoolExecutor
+from itertools import repeat
+from typing import Dict, List, Optional, Tuple, TYPE_CHECKING
+
+from game.action import Action, get_legal_actions, apply_action
+from game.game_engine import GameSimulator
+from ai.simulation import seeded_random
 
 if TYPE_CHECKING:
     from game.game_state import GameState
-    from game.action import Action
 
 
-@dataclass
 class MCTSNode:
-    """Node in the MCTS tree."""
-    state: 'GameState'
-    parent: Optional['MCTSNode'] = None
-    parent_action: Optional['Action'] = None
-    children: Dict[int, 'MCTSNode'] = field(default_factory=dict)  # action_idx -> node
-    visits: int = 0
-    total_value: float = 0.0
-    untried_actions: List['Action'] = field(default_factory=list)
+    """Node in the MCTS tree.
+
+    ``state`` is only kept while the node still has untried actions to
+    expand from (or is a leaf); fully expanded nodes drop it.
+    """
+    state: Optional['GameState']
+    parent: Optional['MCTSNode']
+    parent_action: Optional['Action']
+    # Indexed like this node's legal actions; None until that action is expanded
+    children: List[Optional['MCTSNode']]
+    visits: int
+    total_value: float
+    # (index in this node's legal actions, action) pairs not yet expanded
+    untried_actions: List[Tuple[int, 'Action']]
+    terminal: bool
+
+    __slots__ = ('state', 'parent', 'parent_action', 'children', 'visits',
+                 'total_value', 'untried_actions', 'terminal')
+
+    def __init__(self, state: Optional['GameState'],
+                 parent: Optional['MCTSNode'] = None,
+                 parent_action: Optional['Action'] = None,
+                 children: Optional[List[Optional['MCTSNode']]] = None,
+                 visits: int = 0, total_value: float = 0.0,
+                 untried_actions: Optional[List[Tuple[int, 'Action']]] = None,
+                 terminal: bool = False):
+        self.state = state
+        self.parent = parent
+        self.parent_action = parent_action
+        self.children = children if children is not None else []
+        self.visits = visits
+        self.total_value = total_value
+        self.untried_actions = untried_actions if untried_actions is not None else []
+        self.terminal = terminal
 
     @property
     def value(self) -> float:
@@ -37,7 +66,7 @@ class MCTSNode:
 
     def is_terminal(self) -> bool:
         """Check if this is a terminal state."""
-        return self.state.is_game_over()
+        return self.terminal
 
     def ucb1(self, exploration: float = 1.41) -> float:
         """Calculate UCB1 score for node selection."""
@@ -52,6 +81,30 @@ class MCTSNode:
         )
         return exploitation + exploration_term
 
+    def select_child(self, exploration: float = 1.41) -> 'MCTSNode':
+        """Select the child with the highest UCB1 score.
+
+        Scores all children in one pass, taking this node's log visit count
+        once instead of per child. Picks the same child as maximizing
+        ``ucb1`` (first one wins ties). Only called on fully expanded nodes,
+        so every child slot is filled.
+        """
+        log_visits = math.log(self.visits) if self.visits > 0 else 0.0
+        best_child = None
+        best_score = float('-inf')
+
+        for child in self.children:
+            visits = child.visits
+            if visits == 0:
+                return child  # Unvisited children score infinity
+
+            score = child.total_value / visits + exploration * math.sqrt(log_visits / visits)
+            if score > best_score:
+                best_score = score
+                best_child = child
+
+        return best_child
+
 
 class MCTS:
     """Monte Carlo Tree Search with determinization for hidden information."""
@@ -61,7 +114,9 @@ class MCTS:
         iterations: int = 1000,
         exploration: float = 1.41,
         determinizations: int = 5,
-        rollout_depth: int = 50
+        rollout_depth: int = 50,
+        max_workers: int = 1,
+        rollout_reuse: int = 0
     ):
         """Initialize MCTS.
 
@@ -70,11 +125,21 @@ class MCTS:
             exploration: UCB1 exploration constant
             determinizations: Number of determinized samples to average
             rollout_depth: Maximum depth for rollout simulations
+            max_workers: Processes searching determinizations in parallel
+                (1 searches them in-process)
+            rollout_reuse: Rollouts from one information set before its
+                mean value is reused instead of simulating (0, the default,
+                always simulates)
         """
         self.iterations = iterations
         self.exploration = exploration
         self.determinizations = determinizations
         self.rollout_depth = rollout_depth
+        self.max_workers = max_workers
+        self.rollout_reuse = rollout_reuse
+        # Rollout (total value, count) per information set, reset for each
+        # determinization so pooled and in-process searches agree
+        self._rollout_values: Dict[tuple, Tuple[float, int]] = {}
 
     def search(self, state: 'GameState', player_idx: int) -> 'Action':
         """Search for the best action from the given state.
@@ -89,58 +154,115 @@ class MCTS:
         Returns:
             The best action found
         """
-        from game.action import get_legal_actions
-
         # Get legal actions
         actions = get_legal_actions(state)
         if len(actions) == 1:
             return actions[0]
 
-        # Aggregate action scores across determinizations
-        action_scores: Dict[int, float] = {i: 0.0 for i in range(len(actions))}
-        action_visits: Dict[int, int] = {i: 0 for i in range(len(actions))}
-
-        for _ in range(self.determinizations):
-            # Create determinized state
-            det_state = state.determinize_for_player(player_idx)
-
-            # Run MCTS on determinized state
-            root = self._create_node(det_state)
-            root.untried_actions = list(actions)  # Use same action list
-
-            for _ in range(self.iterations):
-                node = self._select(root)
-                if not node.is_terminal():
-                    if not node.is_fully_expanded():
-                        node = self._expand(node)
-                    value = self._rollout(node.state, player_idx)
-                else:
-                    value = self._evaluate_terminal(node.state, player_idx)
-                self._backpropagate(node, value)
-
-            # Aggregate results
-            for action_idx, child in root.children.items():
-                action_scores[action_idx] += child.total_value
-                action_visits[action_idx] += child.visits
+        root_stats = self._root_statistics(state, player_idx, actions)
 
         # Select action with highest average value
         best_action_idx = max(
             range(len(actions)),
             key=lambda i: (
-                action_scores[i] / action_visits[i]
-                if action_visits[i] > 0 else -float('inf')
+                root_stats[i][0] / root_stats[i][1]
+                if root_stats[i][1] > 0 else -float('inf')
             )
         )
 
         return actions[best_action_idx]
 
+    def _root_statistics(
+        self,
+        state: 'GameState',
+        player_idx: int,
+        actions: List['Action']
+    ) -> Dict[int, Tuple[float, int]]:
+        """Search every determinization and sum their root statistics.
+
+        Args:
+            state: Current game state
+            player_idx: Index of the player making the decision
+            actions: Legal actions at the root
+
+        Returns:
+            Total value and visit count per root action index
+        """
+        # Sample every world and search seed up front, so the statistics
+        # don't depend on which process searches which determinization
+        det_states = [
+            state.determinize_for_player(player_idx)
+            for _ in range(self.determinizations)
+        ]
+        seeds = [random.getrandbits(64) for _ in det_states]
+
+        # Each determinization grows an independent tree, so they can be
+        # searched in separate processes and merged at the root
+        if self.max_workers == 1:
+            results = map(
+                _search_determinization, repeat(self), det_states,
+                repeat(player_idx), repeat(actions), seeds
+            )
+        else:
+            workers = min(self.max_workers, self.determinizations)
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                results = list(executor.map(
+                    _search_determinization, repeat(self), det_states,
+                    repeat(player_idx), repeat(actions), seeds
+                ))
+
+        # Aggregate results
+        root_stats = {i: (0.0, 0) for i in range(len(actions))}
+        for det_stats in results:
+            for action_idx, (total_value, visits) in det_stats.items():
+                old_total, old_visits = root_stats[action_idx]
+                root_stats[action_idx] = (old_total + total_value, old_visits + visits)
+
+        return root_stats
+
+    def _search_determinization(
+        self,
+        det_state: 'GameState',
+        player_idx: int,
+        actions: List['Action']
+    ) -> Dict[int, Tuple[float, int]]:
+        """Run MCTS on one determinized state.
+
+        Args:
+            det_state: Determinized state to search
+            player_idx: Index of the player making the decision
+            actions: Legal actions at the root
+
+        Returns:
+            Total value and visit count per explored root action index
+        """
+        self._rollout_values = {}
+        root = self._create_node(det_state)
+        root.untried_actions = list(enumerate(actions))  # Use same action list
+        root.children = [None] * len(actions)
+
+        for _ in range(self.iterations):
+            node = self._select(root)
+            if not node.is_terminal():
+                if not node.is_fully_expanded():
+                    node = self._expand(node)
+                value = self._rollout(node.state, player_idx)
+            else:
+                value = self._evaluate_terminal(node.state, player_idx)
+            self._backpropagate(node, value)
+
+        return {
+            action_idx: (child.total_value, child.visits)
+            for action_idx, child in enumerate(root.children)
+            if child is not None
+        }
+
     def _create_node(self, state: 'GameState') -> MCTSNode:
         """Create a new MCTS node."""
-        from game.action import get_legal_actions
-
-        node = MCTSNode(state=state)
-        if not state.is_game_over():
-            node.untried_actions = get_legal_actions(state)
+        node = MCTSNode(state=state, terminal=state.is_game_over())
+        if not node.terminal:
+            node.untried_actions = list(enumerate(get_legal_actions(state)))
+            node.children = [None] * len(node.untried_actions)
         return node
 
     def _select(self, node: MCTSNode) -> MCTSNode:
@@ -152,24 +274,21 @@ class MCTS:
             if not node.children:
                 return node  # No children, treat as terminal
             # Select child with highest UCB1
-            best_child = max(
-                node.children.values(),
-                key=lambda n: n.ucb1(self.exploration)
-            )
-            node = best_child
+            node = node.select_child(self.exploration)
         return node
 
     def _expand(self, node: MCTSNode) -> MCTSNode:
         """Expand the node by trying an untried action."""
-        from game.action import apply_action
-
         # Pick a random untried action
-        action_idx = random.randrange(len(node.untried_actions))
-        action = node.untried_actions.pop(action_idx)
+        action_idx, action = node.untried_actions.pop(
+            random.randrange(len(node.untried_actions))
+        )
 
         # Apply action to get new state
         new_state = node.state.copy()
         new_state = apply_action(new_state, action)
+        if not node.untried_actions:
+            node.state = None  # Nothing left to expand from it
 
         # Create child node
         child = self._create_node(new_state)
@@ -177,32 +296,22 @@ class MCTS:
         child.parent_action = action
 
         # Store child by the action's index in the original list
-        # We need to find the original index
-        from game.action import get_legal_actions
-        original_actions = get_legal_actions(node.state)
-        for i, orig_action in enumerate(original_actions):
-            if self._actions_equal(orig_action, action):
-                node.children[i] = child
-                break
+        node.children[action_idx] = child
 
         return child
 
-    def _actions_equal(self, a1: 'Action', a2: 'Action') -> bool:
-        """Check if two actions are equivalent."""
-        if a1.action_type != a2.action_type:
-            return False
-        if a1.player_idx != a2.player_idx:
-            return False
-        if a1.card is not None and a2.card is not None:
-            if a1.card.instance_id != a2.card.instance_id:
-                return False
-        elif a1.card is not a2.card:
-            return False
-        return True
-
     def _rollout(self, state: 'GameState', player_idx: int) -> float:
-        """Perform a random rollout and return the value."""
-        from game.action import get_legal_actions, apply_action
+        """Perform a random rollout and return the value.
+
+        Leaves of one determinization's tree reached again through a
+        different action order share an information set; once it has been
+        rolled out ``rollout_reuse`` times its mean value is returned instead.
+        """
+        if self.rollout_reuse:
+            key = state.info_set_key(player_idx)
+            total_value, count = self._rollout_values.get(key, (0.0, 0))
+            if count >= self.rollout_reuse:
+                return total_value / count
 
         state = state.copy()
         depth = 0
@@ -215,18 +324,18 @@ class MCTS:
             state = apply_action(state, action)
             depth += 1
 
-        return self._evaluate_terminal(state, player_idx)
+        value = self._evaluate_terminal(state, player_idx)
+        if self.rollout_reuse:
+            self._rollout_values[key] = (total_value + value, count + 1)
+        return value
 
     def _evaluate_terminal(self, state: 'GameState', player_idx: int) -> float:
         """Evaluate a terminal or near-terminal state."""
-        if state.winner == player_idx:
-            return 1.0
-        elif state.winner is not None:
-            return 0.0
-
-        # Non-terminal: use heuristic evaluation
-        from game.game_engine import GameSimulator
-        return GameSimulator.evaluate_state(state, player_idx)
+        winner = state.winner
+        if winner is None:
+            # Non-terminal (depth-capped rollout): use heuristic evaluation
+            return GameSimulator.evaluate_state(state, player_idx)
+        return 1.0 if winner == player_idx else 0.0
 
     def _backpropagate(self, node: MCTSNode, value: float) -> None:
         """Backpropagate the value up the tree."""
@@ -236,6 +345,18 @@ class MCTS:
             node = node.parent
 
 
+def _search_determinization(
+    mcts: MCTS,
+    det_state: 'GameState',
+    player_idx: int,
+    actions: List['Action'],
+    seed: int
+) -> Dict[int, Tuple[float, int]]:
+    """Seed and search one determinized state; module-level so worker processes can run it."""
+    with seeded_random(seed):
+        return mcts._search_determinization(det_state, player_idx, actions)
+
+
 class MCTSPlayer:
     """MCTS-based AI player."""
 
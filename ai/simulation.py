@@ -1,10 +1,26 @@
 """Game simulation utilities for AI planning."""
 
 import random
-from typing import List, Optional, TYPE_CHECKING
+from contextlib import contextmanager
+from typing import Iterator, List, Optional
 
-if TYPE_CHECKING:
-    from game.game_state import GameState
+from game.game_state import GameState, GamePhase
+from game.action import get_legal_actions, apply_action, _process_end_of_turn
+
+
+@contextmanager
+def seeded_random(seed: int) -> Iterator[None]:
+    """Seed the global RNG for the block, then restore the caller's state.
+
+    Parallel searches seed each job so in-process and pooled runs agree;
+    restoring keeps the caller's own random stream where it was.
+    """
+    saved = random.getstate()
+    random.seed(seed)
+    try:
+        yield
+    finally:
+        random.setstate(saved)
 
 
 def simulate_random_playout(
@@ -14,15 +30,12 @@ def simulate_random_playout(
     """Simulate a game to completion with random moves.
 
     Args:
-        state: Starting state (will be copied)
+        state: Starting state (copied once, then played out in place)
         max_turns: Maximum turns before giving up
 
     Returns:
         Winner index or None if max_turns reached
     """
-    from game.game_state import GamePhase
-    from game.action import get_legal_actions, apply_action, _process_end_of_turn
-
     state = state.copy()
     turns = 0
 
@@ -44,7 +57,7 @@ def simulate_random_playout(
 
         # Choose random action
         action = random.choice(actions)
-        state = apply_action(state, action)
+        apply_action(state, action)
         turns += 1
 
     return state.winner
@@ -58,16 +71,13 @@ def simulate_with_policy(
     """Simulate a game using a policy function.
 
     Args:
-        state: Starting state
+        state: Starting state (copied once, then played out in place)
         policy_fn: Function(state, actions) -> action
         max_turns: Maximum turns
 
     Returns:
         Winner index or None
     """
-    from game.game_state import GamePhase
-    from game.action import get_legal_actions, apply_action, _process_end_of_turn
-
     state = state.copy()
     turns = 0
 
@@ -85,7 +95,7 @@ def simulate_with_policy(
             continue
 
         action = policy_fn(state, actions)
-        state = apply_action(state, action)
+        apply_action(state, action)
         turns += 1
 
     return state.winner
@@ -1,12 +1,16 @@
 """Card classes and types for Unstable Unicorns."""
 
 from dataclasses import dataclass, field
-from enum import Enum, auto
+from enum import Enum, IntEnum, auto
 from typing import Optional, List
 
 
-class CardType(Enum):
-    """Types of cards in Unstable Unicorns."""
+class CardType(IntEnum):
+    """Types of cards in Unstable Unicorns.
+
+    An IntEnum so comparisons and dict lookups keyed by card type hash
+    and compare as plain ints on the AI hot paths.
+    """
     BABY_UNICORN = auto()
     BASIC_UNICORN = auto()
     MAGICAL_UNICORN = auto()
@@ -46,7 +50,7 @@ class TargetType(Enum):
     CARD_IN_DECK = auto()
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class Card:
     """Represents a card in Unstable Unicorns.
 
@@ -58,14 +62,19 @@ class Card:
     card_type: CardType              # Type of card
     description: str = ""            # Card effect text
     effect_id: Optional[str] = None  # Links to effect in effect registry
+    _is_unicorn: bool = field(init=False, repr=False, compare=False)
 
-    def is_unicorn(self) -> bool:
-        """Check if this card is a unicorn (counts toward win condition)."""
-        return self.card_type in (
+    def __post_init__(self):
+        # The type never changes, so classify once instead of on every query
+        object.__setattr__(self, "_is_unicorn", self.card_type in (
             CardType.BABY_UNICORN,
             CardType.BASIC_UNICORN,
             CardType.MAGICAL_UNICORN
-        )
+        ))
+
+    def is_unicorn(self) -> bool:
+        """Check if this card is a unicorn (counts toward win condition)."""
+        return self._is_unicorn
 
     def is_playable_to_stable(self) -> bool:
         """Check if this card can be played to a stable."""
@@ -88,12 +97,14 @@ class Card:
         return hash(self.id)
 
     def __eq__(self, other) -> bool:
+        if self is other:
+            return True  # Definitions are shared, so this is the common case
         if not isinstance(other, Card):
             return False
         return self.id == other.id
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class CardInstance:
     """A specific instance of a card in the game.
 
@@ -102,34 +113,33 @@ class CardInstance:
     """
     card: Card
     instance_id: int  # Unique instance identifier
+    # Copied from the card at construction so reads are plain slot loads
+    name: str = field(init=False, repr=False, compare=False)
+    card_type: CardType = field(init=False, repr=False, compare=False)
+    description: str = field(init=False, repr=False, compare=False)
+    effect_id: Optional[str] = field(init=False, repr=False, compare=False)
+    _is_unicorn: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        card = self.card
+        object.__setattr__(self, "name", card.name)
+        object.__setattr__(self, "card_type", card.card_type)
+        object.__setattr__(self, "description", card.description)
+        object.__setattr__(self, "effect_id", card.effect_id)
+        object.__setattr__(self, "_is_unicorn", card.is_unicorn())
 
     def __hash__(self) -> int:
-        return hash((self.card.id, self.instance_id))
+        return self.instance_id
 
     def __eq__(self, other) -> bool:
+        # Instance ids come from one counter, so they identify the card on their own
         if not isinstance(other, CardInstance):
             return False
-        return self.card.id == other.card.id and self.instance_id == other.instance_id
-
-    # Delegate common properties to the underlying card
-    @property
-    def name(self) -> str:
-        return self.card.name
-
-    @property
-    def card_type(self) -> CardType:
-        return self.card.card_type
-
-    @property
-    def description(self) -> str:
-        return self.card.description
-
-    @property
-    def effect_id(self) -> Optional[str]:
-        return self.card.effect_id
+        return self.instance_id == other.instance_id
 
+    # Delegate common queries to the underlying card
     def is_unicorn(self) -> bool:
-        return self.card.is_unicorn()
+        return self._is_unicorn
 
     def is_playable_to_stable(self) -> bool:
         return self.card.is_playable_to_stable()
@@ -3,7 +3,9 @@
 Contains all 127 cards from the base game.
 """
 
-from typing import Dict, List
+from itertools import chain, count, repeat
+from types import MappingProxyType
+from typing import Dict, List, Tuple
 from cards.card import Card, CardType, CardInstance
 
 
@@ -11,7 +13,7 @@ from cards.card import Card, CardType, CardInstance
 # BABY UNICORNS (13 cards, 1 copy each)
 # =============================================================================
 
-BABY_UNICORNS: List[Card] = [
+BABY_UNICORNS: Tuple[Card, ...] = (
     Card(id="baby_red", name="Baby Unicorn (Red)", card_type=CardType.BABY_UNICORN),
     Card(id="baby_pink", name="Baby Unicorn (Pink)", card_type=CardType.BABY_UNICORN),
     Card(id="baby_orange", name="Baby Unicorn (Orange)", card_type=CardType.BABY_UNICORN),
@@ -25,14 +27,14 @@ BABY_UNICORNS: List[Card] = [
     Card(id="baby_rainbow", name="Baby Unicorn (Rainbow)", card_type=CardType.BABY_UNICORN),
     Card(id="baby_death", name="Baby Unicorn (Death)", card_type=CardType.BABY_UNICORN),
     Card(id="baby_narwhal", name="Baby Narwhal", card_type=CardType.BABY_UNICORN),
-]
+)
 
 
 # =============================================================================
 # BASIC UNICORNS (8 unique, 22 total cards)
 # =============================================================================
 
-BASIC_UNICORNS: List[Card] = [
+BASIC_UNICORNS: Tuple[Card, ...] = (
     # Red (3 copies)
     Card(id="basic_red", name="Basic Unicorn (Red)", card_type=CardType.BASIC_UNICORN),
     # Orange (3 copies)
@@ -49,10 +51,10 @@ BASIC_UNICORNS: List[Card] = [
     Card(id="basic_purple", name="Basic Unicorn (Purple)", card_type=CardType.BASIC_UNICORN),
     # Narwhal (1 copy)
     Card(id="basic_narwhal", name="Narwhal", card_type=CardType.BASIC_UNICORN),
-]
+)
 
 # Card copies for deck building
-BASIC_UNICORN_COPIES = {
+BASIC_UNICORN_COPIES = MappingProxyType({
     "basic_red": 3,
     "basic_orange": 3,
     "basic_yellow": 3,
@@ -61,14 +63,14 @@ BASIC_UNICORN_COPIES = {
     "basic_indigo": 3,
     "basic_purple": 3,
     "basic_narwhal": 1,
-}
+})
 
 
 # =============================================================================
 # MAGICAL UNICORNS (33 cards, 1 copy each)
 # =============================================================================
 
-MAGICAL_UNICORNS: List[Card] = [
+MAGICAL_UNICORNS: Tuple[Card, ...] = (
     Card(
         id="alluring_narwhal",
         name="Alluring Narwhal",
@@ -279,14 +281,14 @@ MAGICAL_UNICORNS: List[Card] = [
         description="If this card would be sacrificed or destroyed, you may DISCARD a card instead. If you do, this card returns to your Stable.",
         effect_id="unicorn_phoenix"
     ),
-]
+)
 
 
 # =============================================================================
 # MAGIC CARDS (16 unique types, varying copies)
 # =============================================================================
 
-MAGIC_CARDS: List[Card] = [
+MAGIC_CARDS: Tuple[Card, ...] = (
     Card(
         id="back_kick",
         name="Back Kick",
@@ -392,10 +394,10 @@ MAGIC_CARDS: List[Card] = [
         description="Swap a Unicorn card in your Stable with a Unicorn card in any other Stable. This does not trigger any effects.",
         effect_id="unicorn_swap"
     ),
-]
+)
 
 # Card copies for magic cards
-MAGIC_CARD_COPIES = {
+MAGIC_CARD_COPIES = MappingProxyType({
     "back_kick": 3,
     "blatant_thievery": 1,
     "change_of_luck": 2,
@@ -411,14 +413,14 @@ MAGIC_CARD_COPIES = {
     "unfair_bargain": 2,
     "unicorn_poison": 3,
     "unicorn_swap": 2,
-}
+})
 
 
 # =============================================================================
 # UPGRADE CARDS (8 unique types, varying copies)
 # =============================================================================
 
-UPGRADE_CARDS: List[Card] = [
+UPGRADE_CARDS: Tuple[Card, ...] = (
     Card(
         id="caffeine_overload",
         name="Caffeine Overload",
@@ -475,10 +477,10 @@ UPGRADE_CARDS: List[Card] = [
         description="Cards you play cannot be Neigh'd.",
         effect_id="yay"
     ),
-]
+)
 
 # Card copies for upgrade cards
-UPGRADE_CARD_COPIES = {
+UPGRADE_CARD_COPIES = MappingProxyType({
     "caffeine_overload": 1,
     "claw_machine": 3,
     "double_dutch": 1,
@@ -487,14 +489,14 @@ UPGRADE_CARD_COPIES = {
     "rainbow_lasso": 1,
     "stable_artillery": 3,
     "yay": 2,
-}
+})
 
 
 # =============================================================================
 # DOWNGRADE CARDS (8 unique types, 1 copy each)
 # =============================================================================
 
-DOWNGRADE_CARDS: List[Card] = [
+DOWNGRADE_CARDS: Tuple[Card, ...] = (
     Card(
         id="barbed_wire",
         name="Barbed Wire",
@@ -551,14 +553,14 @@ DOWNGRADE_CARDS: List[Card] = [
         description="If at any time you have more than 5 Unicorns in your Stable, SACRIFICE a Unicorn card.",
         effect_id="tiny_stable"
     ),
-]
+)
 
 
 # =============================================================================
 # INSTANT CARDS (2 unique types, varying copies)
 # =============================================================================
 
-INSTANT_CARDS: List[Card] = [
+INSTANT_CARDS: Tuple[Card, ...] = (
     Card(
         id="neigh",
         name="Neigh",
@@ -573,13 +575,26 @@ INSTANT_CARDS: List[Card] = [
         description="Play this card when another player tries to play a card. Stop their card from being played and send it to the discard pile. This card cannot be Neigh'd.",
         effect_id="super_neigh"
     ),
-]
+)
 
 # Card copies for instant cards
-INSTANT_CARD_COPIES = {
+INSTANT_CARD_COPIES = MappingProxyType({
     "neigh": 14,
     "super_neigh": 1,
-}
+})
+
+# Card id of every copy in the deck, in deck-building order
+_DECK_CARD_IDS: Tuple[str, ...] = tuple(chain(
+    chain.from_iterable(repeat(cid, n) for cid, n in BASIC_UNICORN_COPIES.items()),
+    (card.id for card in MAGICAL_UNICORNS),
+    chain.from_iterable(repeat(cid, n) for cid, n in MAGIC_CARD_COPIES.items()),
+    chain.from_iterable(repeat(cid, n) for cid, n in UPGRADE_CARD_COPIES.items()),
+    (card.id for card in DOWNGRADE_CARDS),
+    chain.from_iterable(repeat(cid, n) for cid, n in INSTANT_CARD_COPIES.items()),
+))
+
+# Card id of every baby unicorn in the nursery
+_NURSERY_CARD_IDS: Tuple[str, ...] = tuple(card.id for card in BABY_UNICORNS)
 
 
 # =============================================================================
@@ -591,78 +606,57 @@ class CardDatabase:
 
     def __init__(self):
         self._cards: Dict[str, Card] = {}
-        self._instance_counter = 0
+        self._instance_counter = count(1)
         self._load_cards()
 
+        # Deck contents never change and instances are immutable, so every
+        # game shares one set and only copies the list
+        self._deck_template: Tuple[CardInstance, ...] = tuple(
+            self.create_instance(card_id) for card_id in _DECK_CARD_IDS
+        )
+        self._nursery_template: Tuple[CardInstance, ...] = tuple(
+            self.create_instance(card_id) for card_id in _NURSERY_CARD_IDS
+        )
+
     def _load_cards(self) -> None:
         """Load all cards into the database."""
-        for card in BABY_UNICORNS:
-            self._cards[card.id] = card
-        for card in BASIC_UNICORNS:
-            self._cards[card.id] = card
-        for card in MAGICAL_UNICORNS:
-            self._cards[card.id] = card
-        for card in MAGIC_CARDS:
-            self._cards[card.id] = card
-        for card in UPGRADE_CARDS:
-            self._cards[card.id] = card
-        for card in DOWNGRADE_CARDS:
-            self._cards[card.id] = card
-        for card in INSTANT_CARDS:
-            self._cards[card.id] = card
+        self._cards.update((card.id, card) for card in chain(
+            BABY_UNICORNS,
+            BASIC_UNICORNS,
+            MAGICAL_UNICORNS,
+            MAGIC_CARDS,
+            UPGRADE_CARDS,
+            DOWNGRADE_CARDS,
+            INSTANT_CARDS,
+        ))
+
+        # Bucket by type once; the card set never changes after loading
+        by_type: Dict[CardType, List[Card]] = {}
+        for card in self._cards.values():
+            by_type.setdefault(card.card_type, []).append(card)
+        self._by_type: Dict[CardType, Tuple[Card, ...]] = {
+            card_type: tuple(cards) for card_type, cards in by_type.items()
+        }
 
     def get_card(self, card_id: str) -> Card:
         """Get a card by ID."""
-        if card_id not in self._cards:
-            raise ValueError(f"Unknown card ID: {card_id}")
-        return self._cards[card_id]
+        try:
+            return self._cards[card_id]
+        except KeyError:
+            raise ValueError(f"Unknown card ID: {card_id}") from None
 
     def create_instance(self, card_id: str) -> CardInstance:
         """Create a new instance of a card."""
         card = self.get_card(card_id)
-        self._instance_counter += 1
-        return CardInstance(card=card, instance_id=self._instance_counter)
+        return CardInstance(card=card, instance_id=next(self._instance_counter))
 
     def create_deck(self) -> List[CardInstance]:
         """Create a full deck of cards (excluding baby unicorns)."""
-        deck: List[CardInstance] = []
-
-        # Add basic unicorns
-        for card_id, copies in BASIC_UNICORN_COPIES.items():
-            for _ in range(copies):
-                deck.append(self.create_instance(card_id))
-
-        # Add magical unicorns (1 copy each)
-        for card in MAGICAL_UNICORNS:
-            deck.append(self.create_instance(card.id))
-
-        # Add magic cards
-        for card_id, copies in MAGIC_CARD_COPIES.items():
-            for _ in range(copies):
-                deck.append(self.create_instance(card_id))
-
-        # Add upgrade cards
-        for card_id, copies in UPGRADE_CARD_COPIES.items():
-            for _ in range(copies):
-                deck.append(self.create_instance(card_id))
-
-        # Add downgrade cards (1 copy each)
-        for card in DOWNGRADE_CARDS:
-            deck.append(self.create_instance(card.id))
-
-        # Add instant cards
-        for card_id, copies in INSTANT_CARD_COPIES.items():
-            for _ in range(copies):
-                deck.append(self.create_instance(card_id))
-
-        return deck
+        return list(self._deck_template)
 
     def create_nursery(self) -> List[CardInstance]:
         """Create the nursery with all baby unicorns."""
-        nursery: List[CardInstance] = []
-        for card in BABY_UNICORNS:
-            nursery.append(self.create_instance(card.id))
-        return nursery
+        return list(self._nursery_template)
 
     def get_all_cards(self) -> List[Card]:
         """Get all unique cards."""
@@ -670,7 +664,7 @@ class CardDatabase:
 
     def get_cards_by_type(self, card_type: CardType) -> List[Card]:
         """Get all cards of a specific type."""
-        return [c for c in self._cards.values() if c.card_type == card_type]
+        return list(self._by_type.get(card_type, ()))
 
 
 # Global card database instance
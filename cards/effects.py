@@ -2,16 +2,20 @@
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from enum import Enum, auto
-from typing import TYPE_CHECKING, Any, Callable, Dict, List, Optional, Tuple
+from enum import IntEnum, auto
+from typing import TYPE_CHECKING, Any, Callable, Dict, Optional, Tuple
 
 if TYPE_CHECKING:
     from game.game_state import GameState
     from cards.card import CardInstance
 
 
-class EffectTrigger(Enum):
-    """When an effect triggers."""
+class EffectTrigger(IntEnum):
+    """When an effect triggers.
+
+    This and the other effect enums are IntEnums so the comparisons and set
+    membership tests in effect resolution run as plain int operations.
+    """
     NONE = auto()
     ON_ENTER = auto()          # When card enters a stable
     ON_LEAVE = auto()          # When card leaves a stable
@@ -22,7 +26,7 @@ class EffectTrigger(Enum):
     INSTANT = auto()           # Can interrupt (Neigh cards)
 
 
-class TargetType(Enum):
+class TargetType(IntEnum):
     """Types of valid targets for effects."""
     NONE = auto()
     SELF = auto()                     # The card itself
@@ -49,7 +53,7 @@ class TargetType(Enum):
     BABY_UNICORN = auto()             # Baby unicorn in nursery
 
 
-class ActionType(Enum):
+class ActionType(IntEnum):
     """Types of actions effects can perform."""
     DESTROY = auto()          # Send card to discard
     SACRIFICE = auto()        # Owner sends own card to discard
@@ -71,7 +75,7 @@ class ActionType(Enum):
     ADD_TO_HAND = auto()      # Add target card to controller's hand
 
 
-@dataclass
+@dataclass(frozen=True, slots=True)
 class EffectTarget:
     """Represents a target for an effect."""
     target_type: TargetType
@@ -79,8 +83,13 @@ class EffectTarget:
     optional: bool = False    # Whether targeting is optional ("you may")
     controller_chooses: bool = True  # Who chooses the target
 
+    def __deepcopy__(self, memo) -> 'EffectTarget':
+        # Effect definitions are immutable, so deep copies of game state
+        # share them instead of duplicating the catalogue
+        return self
 
-@dataclass
+
+@dataclass(frozen=True, slots=True)
 class EffectAction:
     """A single action within an effect."""
     action_type: ActionType
@@ -88,8 +97,15 @@ class EffectAction:
     value: int = 1            # Amount (cards to draw, etc.)
     condition: Optional[str] = None  # Condition that must be met
 
+    def __deepcopy__(self, memo) -> 'EffectAction':
+        return self
+
 
-@dataclass
+# Target types that don't need the player to choose anything
+UNTARGETED_TYPES = frozenset({TargetType.NONE, TargetType.SELF})
+
+
+@dataclass(frozen=True, slots=True)
 class Effect:
     """Represents a card's effect.
 
@@ -98,7 +114,7 @@ class Effect:
     effect_id: str
     name: str
     trigger: EffectTrigger
-    actions: List[EffectAction] = field(default_factory=list)
+    actions: Tuple[EffectAction, ...] = ()
     description: str = ""
 
     # For continuous effects
@@ -108,13 +124,24 @@ class Effect:
     # For conditional effects
     condition: Optional[str] = None  # e.g., "if_unicorn_count_gte_3"
 
+    _requires_target: bool = field(init=False, repr=False, compare=False)
+
+    def __post_init__(self):
+        # Registrations list their actions; store them as a tuple so the
+        # effect can't change after it is registered
+        object.__setattr__(self, "actions", tuple(self.actions))
+        # Effects are built once at registration, so classify them up front
+        object.__setattr__(self, "_requires_target", any(
+            action.target.target_type not in UNTARGETED_TYPES
+            for action in self.actions
+        ))
+
+    def __deepcopy__(self, memo) -> 'Effect':
+        return self
+
     def requires_target(self) -> bool:
         """Check if this effect requires player to choose targets."""
-        return any(
-            action.target.target_type != TargetType.NONE
-            and action.target.target_type != TargetType.SELF
-            for action in self.actions
-        )
+        return self._requires_target
 
 
 class EffectRegistry:
@@ -125,16 +152,32 @@ class EffectRegistry:
 
     def __init__(self):
         self._effects: Dict[str, Effect] = {}
+        # effect_id -> Effect for each trigger, so stable scans for one
+        # trigger need a single lookup per card
+        self._by_trigger: Dict[EffectTrigger, Dict[str, Effect]] = {
+            trigger: {} for trigger in EffectTrigger
+        }
         self._register_base_effects()
 
     def register(self, effect: Effect) -> None:
         """Register an effect."""
+        previous = self._effects.get(effect.effect_id)
+        if previous is not None:
+            del self._by_trigger[previous.trigger][previous.effect_id]
         self._effects[effect.effect_id] = effect
+        self._by_trigger[effect.trigger][effect.effect_id] = effect
 
     def get(self, effect_id: str) -> Optional[Effect]:
         """Get an effect by ID."""
         return self._effects.get(effect_id)
 
+    def get_by_trigger(self, trigger: EffectTrigger) -> Dict[str, Effect]:
+        """Get the effects with a trigger, keyed by effect ID.
+
+        The returned mapping is the registry's own index; don't modify it.
+        """
+        return self._by_trigger[trigger]
+
     def _register_base_effects(self) -> None:
         """Register all base game effects."""
 
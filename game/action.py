@@ -3,9 +3,9 @@
 Defines all possible player actions and how to apply them.
 """
 
-from dataclasses import dataclass
+from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import TYPE_CHECKING, List, Optional, Union, Tuple
+from typing import TYPE_CHECKING, Any, List, Optional, Union, Tuple
 
 from cards.card import CardInstance, CardType
 from cards.effects import EFFECT_REGISTRY, TargetType, EffectAction
@@ -55,6 +55,22 @@ class Action:
     # For multi-target effects
     target_cards: Optional[List[CardInstance]] = None
 
+    # Lazily built by search_key()
+    _search_key: Optional[str] = field(default=None, init=False, repr=False, compare=False)
+
+    def search_key(self) -> str:
+        """Key identifying this action by type and card instance.
+
+        Built on first use and kept on the action, since searches look the
+        same action up many times.
+        """
+        if self._search_key is None:
+            if self.card:
+                self._search_key = f"{self.action_type.name}_{self.card.instance_id}"
+            else:
+                self._search_key = self.action_type.name
+        return self._search_key
+
     def __repr__(self) -> str:
         if self.action_type == ActionType.PLAY_CARD:
             return f"Play({self.card.name})"
@@ -115,11 +131,14 @@ def get_legal_actions(state: 'GameState') -> List[Action]:
 
         # Check if player has actions remaining
         if state.actions_remaining > 0:
+            # Rule checks that don't depend on the card are done once per call
+            other_players = state.get_other_players(player_idx)
+            basic_blocked = _basic_unicorns_blocked(state, player_idx)
+
             # Add playable cards from hand
             for card in player.hand:
                 if card.card_type == CardType.DOWNGRADE:
                     # Downgrades require choosing a target player
-                    other_players = state.get_other_players(player_idx)
                     for target_p in other_players:
                         actions.append(Action(
                             action_type=ActionType.PLAY_CARD,
@@ -127,7 +146,7 @@ def get_legal_actions(state: 'GameState') -> List[Action]:
                             card=card,
                             target_player_idx=target_p.player_idx
                         ))
-                elif _can_play_card(state, player_idx, card):
+                elif _can_play_card(state, player_idx, card, basic_blocked):
                     actions.append(Action(
                         action_type=ActionType.PLAY_CARD,
                         player_idx=player_idx,
@@ -164,8 +183,23 @@ def get_legal_actions(state: 'GameState') -> List[Action]:
     return actions
 
 
-def _can_play_card(state: 'GameState', player_idx: int, card: CardInstance) -> bool:
-    """Check if a player can legally play a card."""
+def _can_play_card(
+    state: 'GameState',
+    player_idx: int,
+    card: CardInstance,
+    basic_blocked: Optional[bool] = None
+) -> bool:
+    """Check if a player can legally play a card.
+
+    Args:
+        state: Current game state
+        player_idx: Player trying to play the card
+        card: Card being played
+        basic_blocked: Precomputed result of _basic_unicorns_blocked, if known
+
+    Returns:
+        True if the card can be played
+    """
     player = state.players[player_idx]
 
     # Check card type restrictions
@@ -184,14 +218,24 @@ def _can_play_card(state: 'GameState', player_idx: int, card: CardInstance) -> b
 
     # Check if basic unicorns are blocked by Queen Bee
     if card.card_type == CardType.BASIC_UNICORN:
-        for p in state.players:
-            for c in p.stable:
-                if c.card.effect_id == "queen_bee_unicorn" and p.player_idx != player_idx:
-                    return False
+        if basic_blocked is None:
+            basic_blocked = _basic_unicorns_blocked(state, player_idx)
+        return not basic_blocked
 
     return True
 
 
+def _basic_unicorns_blocked(state: 'GameState', player_idx: int) -> bool:
+    """Check if another player's Queen Bee stops this player playing basic unicorns."""
+    for p in state.players:
+        if p.player_idx == player_idx:
+            continue
+        for c in p.stable:
+            if c.card.effect_id == "queen_bee_unicorn":
+                return True
+    return False
+
+
 def _get_neigh_actions(state: 'GameState') -> List[Action]:
     """Get Neigh-related actions when a card is being played."""
     actions: List[Action] = []
@@ -235,7 +279,7 @@ def _get_neigh_actions(state: 'GameState') -> List[Action]:
     return actions
 
 
-def _get_effect_choice_actions(state: 'GameState', action: Action) -> List[Action]:
+def _get_effect_choice_actions(state: 'GameState') -> List[Action]:
     """Get actions for choosing targets for pending effects."""
     # ... (existing logic to setup) ...
     # This replacement replaces the whole function to handle player targets
@@ -373,7 +417,11 @@ def _get_valid_targets(state: 'GameState', target_type: TargetType, controller_i
 
 
 def apply_action(state: 'GameState', action: Action) -> 'GameState':
-    """Apply an action to the game state and return the new state."""
+    """Apply an action to the game state.
+
+    The state is mutated in place and returned for convenience; callers
+    that need to keep the original must copy it first.
+    """
     from game.game_state import GamePhase
 
     if action.action_type == ActionType.DRAW_CARD:
@@ -397,8 +445,12 @@ def apply_action(state: 'GameState', action: Action) -> 'GameState':
         _apply_play_card(state, action)
 
     elif action.action_type == ActionType.END_ACTION_PHASE:
-        state.phase = GamePhase.END
-        _process_end_of_turn(state)
+        if len(state.current_player.hand) > 7:
+            # Hand limit: discard down to 7 before the turn can end
+            state.phase = GamePhase.DISCARD_TO_LIMIT
+        else:
+            state.phase = GamePhase.END
+            _process_end_of_turn(state)
 
     elif action.action_type == ActionType.NEIGH:
         _apply_neigh(state, action)
@@ -478,7 +530,7 @@ def _apply_play_card(state: 'GameState', action: Action) -> None:
             return
 
     # No Neigh possible, resolve the card
-    _resolve_card(state, card, action.player_idx)
+    _resolve_card(state, card, action.player_idx, action.target_player_idx)
     state.actions_remaining -= 1
 
 
@@ -561,7 +613,8 @@ def _apply_pass_neigh(state: 'GameState', action: Action) -> None:
         state.actions_remaining -= 1
 
 
-def _resolve_card(state: 'GameState', card: CardInstance, player_idx: int) -> None:
+def _resolve_card(state: 'GameState', card: CardInstance, player_idx: int,
+                  target_player_idx: Optional[int] = None) -> None:
     """Resolve a card that has successfully been played."""
     if card.card_type == CardType.MAGIC:
         _trigger_effect(state, card, player_idx)
@@ -572,8 +625,8 @@ def _resolve_card(state: 'GameState', card: CardInstance, player_idx: int) -> No
         _update_player_flags(state, player_idx)
 
     elif card.card_type == CardType.DOWNGRADE:
-        if action.target_player_idx is not None:
-            target_idx = action.target_player_idx
+        if target_player_idx is not None:
+            target_idx = target_player_idx
             state.add_to_stable(card, target_idx)
             _update_player_flags(state, target_idx)
         else:
@@ -610,10 +663,11 @@ def _trigger_enter_events(state: 'GameState', card: CardInstance, controller_idx
 
     # 2. Trigger other cards that listen for entering cards (e.g., Barbed Wire)
     # Scan all players and their stables
+    enter_effects = EFFECT_REGISTRY.get_by_trigger(EffectTrigger.ON_ENTER)
     for player in state.players:
-        for stable_card in player.get_all_stable_cards():
-            listener_effect = EFFECT_REGISTRY.get(stable_card.card.effect_id)
-            if listener_effect and listener_effect.trigger == EffectTrigger.ON_ENTER:
+        for stable_card in player.iter_stable_cards():
+            listener_effect = enter_effects.get(stable_card.card.effect_id)
+            if listener_effect:
                 # We need to distinguish between "Self Enter" (handled above) and "Other Enter"
                 # The Effect definition usually implies "When THIS card enters" vs "When A card enters"
                 # Our current Effect definition in cards/effects.py is slightly ambiguous on this.
@@ -645,7 +699,7 @@ def _trigger_leave_events(state: 'GameState', card: CardInstance, previous_owner
 
     # 2. Trigger listeners (Barbed Wire)
     player = state.players[previous_owner_idx]
-    for stable_card in player.get_all_stable_cards():
+    for stable_card in player.iter_stable_cards():
         if stable_card == card: continue # Should be gone already but just in case
         
         listener_effect = EFFECT_REGISTRY.get(stable_card.card.effect_id)
@@ -666,9 +720,10 @@ def _process_end_of_turn(state: 'GameState') -> None:
     player_idx = state.current_player_idx
 
     # Scan stable for END_OF_TURN triggers (e.g. Glitter Bomb)
-    for card in player.get_all_stable_cards():
-        effect = EFFECT_REGISTRY.get(card.card.effect_id)
-        if effect and effect.trigger == EffectTrigger.END_OF_TURN:
+    end_effects = EFFECT_REGISTRY.get_by_trigger(EffectTrigger.END_OF_TURN)
+    for card in player.iter_stable_cards():
+        effect = end_effects.get(card.card.effect_id)
+        if effect:
              state.resolution_stack.append(EffectTask(effect, player_idx, card))
 
     # Process stack if any triggers found
@@ -709,9 +764,10 @@ def _process_beginning_of_turn(state: 'GameState') -> None:
         return
 
     # Scan stable for BEGINNING_OF_TURN triggers
-    for card in player.get_all_stable_cards():
-        effect = EFFECT_REGISTRY.get(card.card.effect_id)
-        if effect and effect.trigger == EffectTrigger.BEGINNING_OF_TURN:
+    beginning_effects = EFFECT_REGISTRY.get_by_trigger(EffectTrigger.BEGINNING_OF_TURN)
+    for card in player.iter_stable_cards():
+        effect = beginning_effects.get(card.card.effect_id)
+        if effect:
              state.resolution_stack.append(EffectTask(effect, player_idx, card))
 
     EffectHandler.process_stack(state)
@@ -13,6 +13,9 @@ from game.game_state import GameState, EffectTask
 if TYPE_CHECKING:
     from game.action import Action
 
+# Target types resolved without asking the player
+AUTO_RESOLVED_TARGETS = frozenset({TargetType.NONE, TargetType.SELF, TargetType.CONTROLLER})
+
 
 class EffectHandler:
     """Handles the resolution of card effects."""
@@ -55,9 +58,7 @@ class EffectHandler:
                 needs_target = True
                 
                 # Check for auto-resolvable types
-                if action_def.target.target_type == TargetType.NONE or \
-                   action_def.target.target_type == TargetType.SELF or \
-                   action_def.target.target_type == TargetType.CONTROLLER:
+                if action_def.target.target_type in AUTO_RESOLVED_TARGETS:
                     needs_target = False
                     
                 # Check for "All" value which implies auto-resolution for some types
@@ -281,10 +282,11 @@ class EffectHandler:
                 state.resolution_stack.append(EffectTask(effect, controller_idx, card))
 
         # 2. Trigger other cards that listen for entering cards (e.g., Barbed Wire)
+        enter_effects = EFFECT_REGISTRY.get_by_trigger(EffectTrigger.ON_ENTER)
         for player in state.players:
-            for stable_card in player.get_all_stable_cards():
-                listener_effect = EFFECT_REGISTRY.get(stable_card.card.effect_id)
-                if listener_effect and listener_effect.trigger == EffectTrigger.ON_ENTER:
+            for stable_card in player.iter_stable_cards():
+                listener_effect = enter_effects.get(stable_card.card.effect_id)
+                if listener_effect:
                     if stable_card == card:
                         continue
                         
@@ -304,7 +306,7 @@ class EffectHandler:
 
         # 2. Trigger listeners (Barbed Wire)
         player = state.players[previous_owner_idx]
-        for stable_card in player.get_all_stable_cards():
+        for stable_card in player.iter_stable_cards():
             if stable_card == card: continue
             
             listener_effect = EFFECT_REGISTRY.get(stable_card.card.effect_id)
@@ -2,8 +2,9 @@
 
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import Dict, List, Optional, Set, Any
-from copy import deepcopy
+from typing import Dict, Iterator, List, Optional, Set, Any
+import copy
+from itertools import chain
 import random
 
 from cards.card import CardInstance, CardType
@@ -54,6 +55,10 @@ class PlayerState:
         """Get all cards in stable (unicorns + upgrades + downgrades)."""
         return self.stable + self.upgrades + self.downgrades
 
+    def iter_stable_cards(self) -> Iterator[CardInstance]:
+        """Iterate all cards in stable without building a combined list."""
+        return chain(self.stable, self.upgrades, self.downgrades)
+
     def has_downgrade(self) -> bool:
         """Check if player has any downgrade cards."""
         return len(self.downgrades) > 0
@@ -81,6 +86,13 @@ class PlayerState:
         )
 
 
+@dataclass
+class UnicornSummary:
+    """Unicorn counts for every player, taken in a single pass."""
+    counts: List[int]     # Unicorn count per player index
+    max_other: List[int]  # Highest count among each player's opponents
+
+
 @dataclass
 class GameState:
     """Complete state of the game.
@@ -149,6 +161,22 @@ class GameState:
                 return player.player_idx
         return None
 
+    def unicorn_summary(self) -> UnicornSummary:
+        """Count every player's unicorns once and derive opponent maxima."""
+        counts = [p.unicorn_count() for p in self.players]
+
+        # Track the top two counts so each player's opponent max is O(1)
+        best = second = 0
+        best_idx = -1
+        for idx, count in enumerate(counts):
+            if count > best:
+                best, second, best_idx = count, best, idx
+            elif count > second:
+                second = count
+
+        max_other = [second if idx == best_idx else best for idx in range(len(counts))]
+        return UnicornSummary(counts=counts, max_other=max_other)
+
     def get_other_players(self, player_idx: int) -> List[PlayerState]:
         """Get all players except the specified one."""
         return [p for p in self.players if p.player_idx != player_idx]
@@ -246,7 +274,7 @@ class GameState:
             actions_remaining=self.actions_remaining,
             unicorns_to_win=self.unicorns_to_win,
             winner=self.winner,
-            resolution_stack=deepcopy(self.resolution_stack),
+            resolution_stack=[task.copy() for task in self.resolution_stack],
             card_being_played=self.card_being_played,
             neigh_chain_active=self.neigh_chain_active,
             players_passed_on_neigh=set(self.players_passed_on_neigh),
@@ -289,6 +317,51 @@ class GameState:
 
         return state
 
+    def info_set_key(self, player_idx: int) -> tuple:
+        """Key this state by what a player can observe.
+
+        States with equal keys differ only in information hidden from
+        ``player_idx`` (other players' hands and the draw pile order), so
+        search statistics gathered in one apply to the other.
+        """
+        players = tuple(
+            (
+                frozenset(c.instance_id for c in p.stable),
+                frozenset(c.instance_id for c in p.upgrades),
+                frozenset(c.instance_id for c in p.downgrades),
+                # Hidden hands are only known by size
+                frozenset(c.instance_id for c in p.hand)
+                if p.player_idx == player_idx or p.hand_visible else len(p.hand),
+                p.hand_visible,
+                p.cannot_play_upgrades,
+                p.cannot_play_instants,
+                p.cards_cannot_be_neighd,
+                p.unicorns_cannot_be_destroyed,
+                p.unicorns_are_basic,
+                p.unicorns_are_pandas,
+            )
+            for p in self.players
+        )
+        stack = tuple(
+            (task.source_card.instance_id, task.current_action_idx, len(task.targets_chosen))
+            for task in self.resolution_stack
+        )
+        return (
+            players,
+            len(self.draw_pile),
+            frozenset(c.instance_id for c in self.discard_pile),
+            len(self.nursery),
+            self.current_player_idx,
+            self.phase,
+            self.turn_number,
+            self.actions_remaining,
+            self.winner,
+            stack,
+            self.card_being_played.instance_id if self.card_being_played else None,
+            self.neigh_chain_active,
+            frozenset(self.players_passed_on_neigh),
+        )
+
     def get_legal_actions(self) -> List:
         """Get all legal actions for the current player."""
         # This will be implemented in action.py and linked here
@@ -318,5 +391,16 @@ class EffectTask:
     current_action_idx: int = 0
     targets_chosen: List[Any] = field(default_factory=list)  # Stored targets for multi-step effects
 
+    def copy(self) -> 'EffectTask':
+        """Copy the task's progress, sharing its effect and cards.
+
+        Effects and card instances are never mutated during resolution, so
+        only the chosen-targets list needs its own copy. Progress flags set
+        on the task during resolution are carried over.
+        """
+        task = copy.copy(self)
+        task.targets_chosen = list(self.targets_chosen)
+        return task
+
     def __repr__(self) -> str:
         return f"Task({self.effect.name}, step={self.current_action_idx})"
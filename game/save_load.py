@@ -9,6 +9,7 @@ from dataclasses import asdict
 
 from game.game_state import GameState, PlayerState, GamePhase
 from cards.card_database import CARD_DATABASE
+from cards.card import CardInstance
 
 
 class SaveLoadManager:
@@ -207,10 +208,10 @@ class SaveLoadManager:
         instance_id = data["instance_id"]
 
         # Recreate the card instance with the same instance_id
-        card_instance = CARD_DATABASE.create_instance(card_id)
-        card_instance.instance_id = instance_id
-
-        return card_instance
+        return CardInstance(
+            card=CARD_DATABASE.get_card(card_id),
+            instance_id=instance_id
+        )
 
     def format_save_list(self) -> str:
         """Format a list of saves for display."""
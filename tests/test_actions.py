@@ -41,6 +41,19 @@ class TestAction(unittest.TestCase):
         self.assertEqual(str(action), "EndAction")
 
 
+    def test_search_key(self):
+        """Test that search keys identify type and card instance."""
+        card = CARD_DATABASE.create_instance("rhinocorn")
+        action = Action(action_type=ActionType.PLAY_CARD, player_idx=0, card=card)
+
+        self.assertEqual(action.search_key(), f"PLAY_CARD_{card.instance_id}")
+        self.assertIs(action.search_key(), action.search_key())
+        self.assertEqual(
+            Action(action_type=ActionType.DRAW_CARD, player_idx=0).search_key(),
+            "DRAW_CARD"
+        )
+
+
 class TestGetLegalActions(unittest.TestCase):
     """Tests for get_legal_actions function."""
 
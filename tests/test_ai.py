@@ -1,16 +1,46 @@
 """Unit tests for AI players."""
 
+import random
 import unittest
+from unittest.mock import patch
 from game.game_state import GameState, PlayerState, GamePhase
-from game.action import Action, ActionType, get_legal_actions
+from game.action import Action, ActionType, get_legal_actions, apply_action
 from game.game_engine import GameEngine
 from players.ai_player import RandomPlayer, RuleBasedPlayer
-from ai.mcts import MCTS, MCTSPlayer
-from ai.evolutionary import EvolutionaryPlayer, EvolutionaryWeights, TRAINED_WEIGHTS
-from ai.heuristics import evaluate_state, evaluate_card_value, should_neigh
+from ai.mcts import MCTS, MCTSPlayer, _search_determinization
+from ai.hybrid import (
+    HybridMCTS, HybridNode, ROLLOUT_LEAD_MIN_DEPTH, ROLLOUT_NEAR_WIN_VALUE,
+)
+from ai.ismcts import ISMCTS, ISMCTSNode
+from ai.evolutionary import (
+    EvolutionaryPlayer, EvolutionaryTrainer, EvolutionaryWeights, TRAINED_WEIGHTS,
+)
+from ai.heuristics import (
+    evaluate_state, evaluate_card_value, should_neigh,
+    encode_state_features, evaluate_states_batch,
+)
 from cards.card_database import CARD_DATABASE
 
 
+def _make_state(*hand: str) -> GameState:
+    """Build a two-player game in player 0's action phase with a full deck.
+
+    Args:
+        *hand: Card ids dealt to player 0's hand
+    """
+    players = [
+        PlayerState(player_idx=0, name="P1"),
+        PlayerState(player_idx=1, name="P2"),
+    ]
+    state = GameState(players=players, num_players=2)
+    state.draw_pile = CARD_DATABASE.create_deck()
+    state.phase = GamePhase.ACTION
+    state.actions_remaining = 1
+    for card_id in hand:
+        state.players[0].hand.append(CARD_DATABASE.create_instance(card_id))
+    return state
+
+
 class TestRandomPlayer(unittest.TestCase):
     """Tests for RandomPlayer."""
 
@@ -118,6 +148,72 @@ class TestMCTS(unittest.TestCase):
         self.assertIsNotNone(action)
         self.assertIsInstance(action, Action)
 
+    def test_parallel_statistics_match_in_process(self):
+        """Test that worker processes merge the same root statistics."""
+        state = _make_state("basic_red")
+        actions = get_legal_actions(state)
+
+        stats = []
+        for max_workers in (1, 2):
+            mcts = MCTS(iterations=20, determinizations=3, rollout_depth=10,
+                        max_workers=max_workers)
+            random.seed(7)
+            stats.append(mcts._root_statistics(state, 0, actions))
+
+        self.assertEqual(stats[0], stats[1])
+        self.assertEqual(sum(visits for _, visits in stats[0].values()), 60)
+
+    def test_parallel_statistics_match_in_process_with_rollout_reuse(self):
+        """Test that cached rollouts don't make pooled searches diverge."""
+        state = _make_state("basic_red", "rhinocorn")
+        actions = get_legal_actions(state)
+
+        stats = []
+        for max_workers in (1, 2):
+            mcts = MCTS(iterations=40, determinizations=3, rollout_depth=10,
+                        max_workers=max_workers, rollout_reuse=1)
+            random.seed(7)
+            stats.append(mcts._root_statistics(state, 0, actions))
+
+        self.assertEqual(stats[0], stats[1])
+
+    def test_seeded_search_restores_caller_random_state(self):
+        """Test that seeding a determinization's search in-process leaves
+        the caller's random stream where it was."""
+        mcts = MCTS(iterations=10, rollout_depth=5)
+        state = _make_state("basic_red")
+        actions = get_legal_actions(state)
+        det_state = state.determinize_for_player(0)
+
+        random.seed(3)
+        expected = random.random()
+        random.seed(3)
+        _search_determinization(mcts, det_state, 0, actions, 5)
+
+        self.assertEqual(random.random(), expected)
+
+    def test_rollout_reuses_mean_value(self):
+        """Test that a well-sampled information set returns its mean value."""
+        mcts = MCTS(rollout_depth=10, rollout_reuse=2)
+        state = _make_state()
+        key = state.info_set_key(0)
+
+        values = [mcts._rollout(state, 0), mcts._rollout(state, 0)]
+        self.assertEqual(mcts._rollout_values[key], (sum(values), 2))
+
+        # Third visit reuses the mean without simulating again
+        self.assertEqual(mcts._rollout(state, 0), sum(values) / 2)
+        self.assertEqual(mcts._rollout_values[key], (sum(values), 2))
+
+    def test_rollout_reuse_off_by_default(self):
+        """Test that rollouts are not cached unless reuse is enabled."""
+        mcts = MCTS(rollout_depth=10)
+        state = _make_state()
+
+        mcts._rollout(state, 0)
+
+        self.assertEqual(mcts._rollout_values, {})
+
     def test_single_action_returns_immediately(self):
         """Test that single action is returned without search."""
         mcts = MCTS(iterations=1000)  # High iterations
@@ -135,6 +231,72 @@ class TestMCTS(unittest.TestCase):
         self.assertEqual(action.action_type, ActionType.END_ACTION_PHASE)
 
 
+class TestISMCTS(unittest.TestCase):
+    """Tests for ISMCTS."""
+
+    def test_search_returns_legal_action(self):
+        """Test that ISMCTS search returns one of the legal actions."""
+        ismcts = ISMCTS(iterations=100, rollout_depth=10)
+        state = _make_state()
+        state.draw_card(0, 3)
+        state.draw_card(1, 3)
+
+        action = ismcts.search(state, 0)
+
+        self.assertIn(action, get_legal_actions(state))
+
+    def test_transposition_backpropagates_along_path(self):
+        """Test that an info set reached by two action orders shares a node
+        and each iteration only updates the nodes it passed through."""
+        ismcts = ISMCTS(rollout_depth=5)
+        state = _make_state("basic_red", "basic_blue")
+        state.actions_remaining = 2
+        state.players[0].cards_cannot_be_neighd = True
+        play_red, play_blue = (
+            ismcts._action_key(a) for a in get_legal_actions(state) if a.card
+        )
+
+        # Record the tree actions each iteration takes; a constant rollout
+        # applies none of its own
+        taken = []
+
+        def record(state, action):
+            taken.append(ismcts._action_key(action))
+            return apply_action(state, action)
+
+        ismcts._rollout = lambda state, player_idx: 0.5
+
+        root = ISMCTSNode(player_idx=0)
+        for _ in range(40):
+            before = {id(n): n.visits for n in _reachable_nodes(root)}
+            taken.clear()
+            with patch("ai.ismcts.apply_action", record):
+                ismcts._iterate(root, state.determinize_for_player(0), 0)
+
+            # Exactly the nodes along the actions taken gained a visit
+            path = [root]
+            for key in taken:
+                path.append(path[-1].children[key])
+            gained = [n for n in _reachable_nodes(root)
+                      if n.visits != before.get(id(n), 0)]
+            self.assertCountEqual(map(id, gained), map(id, path))
+
+        both = root.children[play_red].children[play_blue]
+        self.assertIs(both, root.children[play_blue].children[play_red])
+
+
+def _reachable_nodes(root: ISMCTSNode) -> list:
+    """Collect every node of an ISMCTS tree once, following shared nodes."""
+    seen = {id(root): root}
+    stack = [root]
+    while stack:
+        for child in stack.pop().children.values():
+            if id(child) not in seen:
+                seen[id(child)] = child
+                stack.append(child)
+    return list(seen.values())
+
+
 class TestMCTSPlayer(unittest.TestCase):
     """Tests for MCTSPlayer."""
 
@@ -150,6 +312,111 @@ class TestMCTSPlayer(unittest.TestCase):
         self.assertIn(winner, [0, 1])
 
 
+class TestHybridMCTS(unittest.TestCase):
+    """Tests for HybridMCTS."""
+
+    def test_search_returns_action(self):
+        """Test that hybrid search returns a legal action."""
+        hybrid = HybridMCTS(iterations=30, determinizations=2, rollout_depth=10)
+        state = _make_state("basic_red", "rhinocorn")
+
+        action = hybrid.search(state, 0)
+
+        self.assertIsInstance(action, Action)
+        self.assertEqual(action.player_idx, 0)
+
+    def test_parallel_statistics_match_in_process(self):
+        """Test that worker processes merge the same root statistics."""
+        state = _make_state("basic_red", "rhinocorn")
+
+        stats = []
+        for max_workers in (1, 2):
+            hybrid = HybridMCTS(iterations=20, determinizations=3, rollout_depth=10,
+                                max_workers=max_workers)
+            random.seed(7)
+            stats.append({
+                key: (score, visits)
+                for key, (score, visits, _) in hybrid._root_statistics(state, 0).items()
+            })
+
+        self.assertEqual(stats[0], stats[1])
+        self.assertEqual(sum(visits for _, visits in stats[0].values()), 60)
+
+    def test_simulate_stops_when_player_to_act_is_one_from_winning(self):
+        """Test that rollouts score a player about to win as a near-win."""
+        hybrid = HybridMCTS(rollout_depth=30)
+        state = _make_state()
+        for _ in range(state.unicorns_to_win - 1):
+            state.players[1].stable.append(CARD_DATABASE.create_instance("basic_red"))
+
+        # Player 0 can only end its phase, then player 1 is to act
+        self.assertEqual(hybrid._simulate(state, 1), ROLLOUT_NEAR_WIN_VALUE)
+        self.assertEqual(hybrid._simulate(state, 0), 1.0 - ROLLOUT_NEAR_WIN_VALUE)
+
+    def test_simulate_near_win_skips_root_and_pandas(self):
+        """Test that the near-win cutoff ignores the rollout's first state
+        and players whose unicorns are pandas."""
+        hybrid = HybridMCTS(rollout_depth=2)
+        state = _make_state()
+        for _ in range(state.unicorns_to_win - 1):
+            state.players[0].stable.append(CARD_DATABASE.create_instance("basic_red"))
+            state.players[1].stable.append(CARD_DATABASE.create_instance("basic_red"))
+        state.players[1].unicorns_are_pandas = True
+
+        # Player 0 ends its phase, then player 1 draws; both are forced
+        final = state.copy()
+        for _ in range(2):
+            (action,) = get_legal_actions(final)
+            final = apply_action(final, action)
+
+        self.assertEqual(hybrid._simulate(state, 0), evaluate_state(final, 0))
+
+    def test_simulate_stops_on_clear_lead(self):
+        """Test that deep rollouts stop once one player leads by the margin."""
+        hybrid = HybridMCTS(rollout_depth=30)
+        state = _make_state()
+        for _ in range(state.unicorns_to_win - 2):
+            state.players[1].stable.append(CARD_DATABASE.create_instance("basic_red"))
+        steps = []
+
+        def record(state, action):
+            steps.append(action)
+            return apply_action(state, action)
+
+        with patch("ai.hybrid.apply_action", record):
+            hybrid._simulate(state, 0)
+
+        self.assertEqual(len(steps), ROLLOUT_LEAD_MIN_DEPTH)
+
+    def test_remove_untried_keeps_running_sums(self):
+        """Test that removing an expanded action patches the cached sums."""
+        node = HybridNode(_make_state("basic_red", "rhinocorn"))
+        node.untried_actions = ["a", "b", "c", "d"]
+        node.untried_weights = [0.5, 1.0, 2.0, 4.0]
+        node.untried_cum = [0.5, 1.5, 3.5, 7.5]
+
+        node.remove_untried(1)
+        self.assertEqual(node.untried_actions, ["a", "d", "c"])
+        self.assertEqual(node.untried_cum, [0.5, 4.5, 6.5])
+
+        node.remove_untried(2)
+        self.assertEqual(node.untried_actions, ["a", "d"])
+        self.assertEqual(node.untried_cum, [0.5, 4.5])
+
+    def test_select_child_matches_ucb1(self):
+        """Test that child selection maximizes ucb1_with_prior."""
+        root = HybridNode(_make_state("basic_red", "rhinocorn"))
+        for key, values in enumerate([[0.4] * 5, [0.6] * 8, [0.5] * 7]):
+            child = HybridNode(root.state, parent=root, prior_probability=0.1 * (key + 1))
+            for value in values:
+                child.update(value)
+                root.update(value)
+            root.children.append(child)
+
+        expected = max(root.children, key=lambda c: c.ucb1_with_prior(1.0, 0.5))
+        self.assertIs(root.select_child(1.0, 0.5), expected)
+
+
 class TestEvolutionaryWeights(unittest.TestCase):
     """Tests for EvolutionaryWeights."""
 
@@ -175,6 +442,22 @@ class TestEvolutionaryWeights(unittest.TestCase):
             (mutated.unicorn_count, mutated.magical_unicorn)
         )
 
+    def test_vector_round_trip(self):
+        """Test conversion to and from a flat weight vector."""
+        vector = TRAINED_WEIGHTS.to_vector()
+
+        self.assertEqual(len(vector), 20)
+        self.assertEqual(vector[0], TRAINED_WEIGHTS.basic_unicorn)
+        self.assertEqual(EvolutionaryWeights.from_vector(vector), TRAINED_WEIGHTS)
+
+    def test_vector_ignores_non_field_attributes(self):
+        """Test that extra instance attributes stay out of the vector."""
+        weights = EvolutionaryWeights()
+        weights.fitness = 0.5
+
+        self.assertEqual(weights.to_vector(), EvolutionaryWeights().to_vector())
+        self.assertEqual(len(weights.mutate(mutation_rate=1.0).to_vector()), 20)
+
     def test_crossover(self):
         """Test weight crossover."""
         parent1 = EvolutionaryWeights()
@@ -201,6 +484,51 @@ class TestEvolutionaryPlayer(unittest.TestCase):
 
         self.assertEqual(player.weights, TRAINED_WEIGHTS)
 
+    def test_takes_winning_unicorn(self):
+        """Test that a unicorn play that wins outright is chosen."""
+        player = EvolutionaryPlayer("Evo", weights=EvolutionaryWeights(close_to_win=0.0))
+        # Rainbow Aura would otherwise outscore a basic unicorn
+        state = _make_state("rainbow_aura", "basic_blue")
+        for _ in range(6):
+            state.players[0].stable.append(CARD_DATABASE.create_instance("basic_red"))
+
+        chosen = player.choose_action(state, get_legal_actions(state))
+
+        self.assertEqual(chosen.action_type, ActionType.PLAY_CARD)
+        self.assertEqual(chosen.card.card.id, "basic_blue")
+
+    def test_targets_opponents_best_card(self):
+        """Test that targeting prefers the opponent's most valuable card."""
+        player = EvolutionaryPlayer("Evo", weights=TRAINED_WEIGHTS)
+        state = _make_state()
+        own = CARD_DATABASE.create_instance("rhinocorn")
+        basic = CARD_DATABASE.create_instance("basic_red")
+        magical = CARD_DATABASE.create_instance("americorn")
+        state.players[0].stable.append(own)
+        state.players[1].stable.extend([basic, magical])
+
+        chosen = player.choose_target(state, [own, basic, magical], "Destroy a unicorn")
+
+        self.assertIs(chosen, magical)
+
+    def test_target_actions_use_target_scores(self):
+        """Test that the engine's target choices go through target scoring."""
+        player = EvolutionaryPlayer("Evo", weights=TRAINED_WEIGHTS)
+        state = _make_state()
+        own = CARD_DATABASE.create_instance("rhinocorn")
+        basic = CARD_DATABASE.create_instance("basic_red")
+        magical = CARD_DATABASE.create_instance("americorn")
+        state.players[0].stable.append(own)
+        state.players[1].stable.extend([basic, magical])
+        actions = [
+            Action(action_type=ActionType.CHOOSE_TARGET, player_idx=0, target_card=card)
+            for card in (own, basic, magical)
+        ]
+
+        chosen = player.choose_action(state, actions)
+
+        self.assertIs(chosen.target_card, magical)
+
     def test_can_play_game(self):
         """Test that evolutionary player can complete a game."""
         engine = GameEngine(["Evo", "Random"], verbose=False)
@@ -213,6 +541,36 @@ class TestEvolutionaryPlayer(unittest.TestCase):
         self.assertIn(winner, [0, 1])
 
 
+class TestEvolutionaryTrainer(unittest.TestCase):
+    """Tests for EvolutionaryTrainer."""
+
+    def test_parallel_fitness_matches_in_process(self):
+        """Test that games played in worker processes give the same fitness."""
+        fitness = []
+        for max_workers in (1, 2):
+            trainer = EvolutionaryTrainer(
+                population_size=3, games_per_evaluation=2, max_workers=max_workers
+            )
+            random.seed(7)
+            fitness.append(trainer._evaluate_population())
+
+        self.assertEqual(fitness[0], fitness[1])
+        self.assertEqual(len(fitness[0]), 3)
+
+    def test_in_process_fitness_leaves_trainer_random_stream(self):
+        """Test that seeded games only advance the trainer's RNG by their seeds."""
+        trainer = EvolutionaryTrainer(population_size=3, games_per_evaluation=2)
+
+        random.seed(3)
+        for _ in range(6):
+            random.getrandbits(64)  # One seed per game
+        expected = random.random()
+        random.seed(3)
+        trainer._evaluate_population()
+
+        self.assertEqual(random.random(), expected)
+
+
 class TestHeuristics(unittest.TestCase):
     """Tests for heuristic evaluation functions."""
 
@@ -249,6 +607,24 @@ class TestHeuristics(unittest.TestCase):
 
         self.assertGreater(score_3, score_0)
 
+    def test_batch_matches_single_state(self):
+        """Test that batch scoring agrees with evaluate_state."""
+        players = [
+            PlayerState(player_idx=0, name="P1"),
+            PlayerState(player_idx=1, name="P2"),
+        ]
+        state = GameState(players=players, num_players=2)
+        state.players[0].stable.append(CARD_DATABASE.create_instance("ginormous_unicorn"))
+        state.players[0].upgrades.append(CARD_DATABASE.create_instance("yay"))
+        state.players[0].hand.append(CARD_DATABASE.create_instance("neigh"))
+        state.players[1].stable.append(CARD_DATABASE.create_instance("basic_red"))
+
+        rows = [encode_state_features(state, 0), encode_state_features(state, 1)]
+        scores = evaluate_states_batch(rows, state.unicorns_to_win)
+
+        self.assertAlmostEqual(scores[0], evaluate_state(state, 0))
+        self.assertAlmostEqual(scores[1], evaluate_state(state, 1))
+
     def test_should_neigh_critical(self):
         """Test Neigh value for critical situations."""
         players = [
@@ -1,12 +1,13 @@
 """Tests for specific complex card effects."""
 
+import copy
 import unittest
 from game.game_state import GameState, PlayerState, GamePhase, EffectTask
 from game.action import Action, ActionType, apply_action
 from game.effect_handler import EffectHandler
 from cards.card_database import CARD_DATABASE
 from cards.card import CardType
-from cards.effects import EFFECT_REGISTRY, Effect, EffectAction, ActionType as EActionType, TargetType, EffectTrigger, EffectTarget
+from cards.effects import EFFECT_REGISTRY, EffectRegistry, Effect, EffectAction, ActionType as EActionType, TargetType, EffectTrigger, EffectTarget
 
 class TestCardEffects(unittest.TestCase):
     def setUp(self):
@@ -119,5 +120,25 @@ class TestCardEffects(unittest.TestCase):
         det_state_view = self.state.determinize_for_player(1)
         self.assertEqual(det_state_view.players[0].hand[0].card.id, "basic_red")
 
+    def test_registry_indexes_by_trigger(self):
+        """Test that re-registering an effect moves it to its new trigger."""
+        registry = EffectRegistry()
+        self.assertIs(
+            registry.get_by_trigger(EffectTrigger.BEGINNING_OF_TURN)["rhinocorn"],
+            registry.get("rhinocorn"),
+        )
+
+        registry.register(Effect(effect_id="rhinocorn", name="Rhinocorn", trigger=EffectTrigger.ON_ENTER))
+
+        self.assertNotIn("rhinocorn", registry.get_by_trigger(EffectTrigger.BEGINNING_OF_TURN))
+        self.assertIn("rhinocorn", registry.get_by_trigger(EffectTrigger.ON_ENTER))
+
+    def test_effects_shared_by_deepcopy(self):
+        """Test that deep-copying a pending task shares its effect."""
+        effect = EFFECT_REGISTRY.get("glitter_tornado")
+        task = EffectTask(effect, 0, self.get_card("glitter_tornado"))
+
+        self.assertIs(copy.deepcopy(task).effect, effect)
+
 if __name__ == '__main__':
     unittest.main()
\ No newline at end of file
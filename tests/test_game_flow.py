@@ -5,7 +5,8 @@ from game.game_state import GameState, PlayerState, GamePhase
 from game.action import Action, ActionType, apply_action, get_legal_actions
 from cards.card_database import CARD_DATABASE
 from cards.card import CardType
-from cards.effects import EFFECT_REGISTRY, EffectTask
+from cards.effects import EFFECT_REGISTRY
+from game.game_state import EffectTask
 
 class TestGameFlow(unittest.TestCase):
     def setUp(self):
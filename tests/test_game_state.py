@@ -1,8 +1,9 @@
 """Unit tests for game state."""
 
 import unittest
-from game.game_state import GameState, PlayerState, GamePhase
+from game.game_state import GameState, PlayerState, GamePhase, EffectTask
 from cards.card_database import CARD_DATABASE
+from cards.effects import EFFECT_REGISTRY
 
 
 class TestPlayerState(unittest.TestCase):
@@ -183,6 +184,37 @@ class TestGameState(unittest.TestCase):
         # Should not win
         self.assertIsNone(state.check_win_condition())
 
+    def test_unicorn_summary(self):
+        """Test per-player counts and opponent maxima."""
+        players = [
+            PlayerState(player_idx=i, name=f"P{i + 1}") for i in range(3)
+        ]
+        state = GameState(players=players, num_players=3)
+        state.players[0].stable.append(CARD_DATABASE.create_instance("ginormous_unicorn"))
+        state.players[1].stable.append(CARD_DATABASE.create_instance("basic_red"))
+
+        summary = state.unicorn_summary()
+
+        self.assertEqual(summary.counts, [2, 1, 0])
+        self.assertEqual(summary.max_other, [1, 2, 2])
+
+    def test_info_set_key_ignores_hidden_cards(self):
+        """Test that determinizations share the observer's information set."""
+        players = [
+            PlayerState(player_idx=i, name=f"P{i + 1}") for i in range(2)
+        ]
+        state = GameState(players=players, num_players=2)
+        state.draw_pile = CARD_DATABASE.create_deck()
+        state.draw_card(0, 3)
+        state.draw_card(1, 3)
+
+        det = state.determinize_for_player(0)
+        self.assertEqual(det.info_set_key(0), state.info_set_key(0))
+
+        # Playing a card changes what everyone observes
+        det.players[0].stable.append(det.players[0].hand.pop())
+        self.assertNotEqual(det.info_set_key(0), state.info_set_key(0))
+
     def test_draw_card(self):
         """Test drawing cards."""
         players = [PlayerState(player_idx=0, name="P1")]
@@ -280,6 +312,28 @@ class TestGameState(unittest.TestCase):
         self.assertIsNot(copy.players, state.players)
         self.assertIsNot(copy.draw_pile, state.draw_pile)
 
+    def test_state_copy_resolution_stack(self):
+        """Test that copied tasks share definitions but not progress."""
+        players = [PlayerState(player_idx=0, name="P1")]
+        state = GameState(players=players, num_players=1)
+        card = CARD_DATABASE.create_instance("rhinocorn")
+        state.resolution_stack.append(
+            EffectTask(EFFECT_REGISTRY.get("rhinocorn"), 0, card)
+        )
+        state.resolution_stack[0].last_action_was_destroy = True
+
+        copy = state.copy()
+        copied_task = copy.resolution_stack[0]
+        copied_task.current_action_idx += 1
+        copied_task.targets_chosen.append(None)
+
+        task = state.resolution_stack[0]
+        self.assertIs(copied_task.effect, task.effect)
+        self.assertIs(copied_task.source_card, card)
+        self.assertTrue(copied_task.last_action_was_destroy)
+        self.assertEqual(task.current_action_idx, 0)
+        self.assertEqual(task.targets_chosen, [])
+
     def test_determinize_for_player(self):
         """Test determinization for hidden information."""
         players = [